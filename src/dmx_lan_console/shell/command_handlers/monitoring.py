@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import shlex
+from operator import itemgetter
 from typing import Any
 
 from rich import box
@@ -15,6 +16,55 @@ from ..ui_components import FIELD_DESCRIPTIONS
 from . import CommandHandler
 
 
+def _devices_summary(total: int, online: int, offline_count: int) -> Text:
+    """
+    Build the devices monitor summary line without going through Rich markup.
+
+    The styles reproduce what the markup version rendered, including the
+    bold number highlighting Rich applied to printed strings.
+
+    Args:
+        total: Total number of devices
+        online: Number of online devices
+        offline_count: Number of offline devices
+
+    Returns:
+        Styled summary line ending in a blank line
+    """
+    return Text.assemble(
+        ("Total: ", "dim"),
+        (str(total), "bold dim cyan"),
+        (" devices | ", "dim"),
+        (str(online), "bold green"),
+        (" online", "green"),
+        " | ",
+        (str(offline_count), "bold red"),
+        (" offline", "red"),
+        "\n\n",
+    )
+
+
+_DEVICE_SORT_KEY = itemgetter("offline", "id")
+
+
+def _sort_devices(devices: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Sort devices online first, then by ID.
+
+    Missing sort fields are filled in place so the key can be a plain itemgetter.
+
+    Args:
+        devices: Device dictionaries from the /devices endpoint
+
+    Returns:
+        New list of devices in display order
+    """
+    for device in devices:
+        device.setdefault("offline", False)
+        device.setdefault("id", "")
+    return sorted(devices, key=_DEVICE_SORT_KEY)
+
+
 class MonitoringCommandHandler(CommandHandler):
     """Handler for monitoring, logging, and channel commands."""
 
@@ -427,15 +477,28 @@ class MonitoringCommandHandler(CommandHandler):
         except Exception as exc:
             self.shell._handle_error(exc, "monitor")
 
-    def _monitor_dashboard(self) -> None:
-        """Display comprehensive dashboard with health, devices, and statistics."""
+    def _monitor_dashboard(self, use_bundle_cache: bool = False) -> None:
+        """
+        Display comprehensive dashboard with health, devices, and statistics.
+
+        Args:
+            use_bundle_cache: Reuse payloads just prefetched by watch mode
+                instead of fetching them again
+        """
         try:
-            # Fetch data in parallel
             self.shell._append_output("[bold cyan]Fetching dashboard data...[/]\n")
-            health_data = _handle_response(self.client.get("/health"))
-            status_data = _handle_response(self.client.get("/status"))
-            devices_data = _handle_response(self.client.get("/devices"))
-            mappings_data = _handle_response(self.client.get("/mappings"))
+            bundle_cache = self.shell._bundle_cache
+
+            def cached_or_fetch(endpoint: str) -> Any:
+                data = bundle_cache.get(endpoint) if use_bundle_cache else None
+                if data is None:
+                    data = _handle_response(self.client.get(endpoint))
+                return data
+
+            health_data = cached_or_fetch("/health")
+            status_data = cached_or_fetch("/status")
+            devices_data = cached_or_fetch("/devices")
+            mappings_data = cached_or_fetch("/mappings")
 
             # Handle None responses
             if health_data is None:
@@ -449,8 +512,8 @@ class MonitoringCommandHandler(CommandHandler):
 
             # Calculate statistics
             total_devices = len(devices_data) if isinstance(devices_data, list) else 0
-            online_devices = sum(1 for d in devices_data if not d.get("offline")) if isinstance(devices_data, list) else 0
             offline_devices = sum(1 for d in devices_data if d.get("offline")) if isinstance(devices_data, list) else 0
+            online_devices = total_devices - offline_devices
             total_mapped = sum(1 for d in devices_data if d.get("mapping_count", 0) > 0) if isinstance(devices_data, list) else 0
 
             # Calculate dynamic width based on devices table
@@ -634,7 +697,7 @@ class MonitoringCommandHandler(CommandHandler):
                 devices_table.add_column("Maps", justify="right", width=4)
 
                 # Sort devices: online first, then by ID
-                sorted_devices = sorted(devices_data, key=lambda d: (d.get("offline", False), d.get("id", "")))
+                sorted_devices = _sort_devices(devices_data)
 
                 # Show up to 10 devices
                 for device in sorted_devices[:10]:
@@ -762,11 +825,19 @@ class MonitoringCommandHandler(CommandHandler):
         except Exception as exc:
             self.shell._append_output(f"[bold red]Error fetching dashboard:[/] {exc}\n")
 
-    def _monitor_devices(self) -> None:
-        """Display detailed device table with all discovered devices."""
+    def _monitor_devices(self, use_bundle_cache: bool = False) -> None:
+        """
+        Display detailed device table with all discovered devices.
+
+        Args:
+            use_bundle_cache: Reuse the payload just prefetched by watch mode
+                instead of fetching it again
+        """
         try:
             self.shell._append_output("[bold cyan]Fetching device data...[/]\n")
-            devices_data = _handle_response(self.client.get("/devices"))
+            devices_data = self.shell._bundle_cache.get("/devices") if use_bundle_cache else None
+            if devices_data is None:
+                devices_data = _handle_response(self.client.get("/devices"))
 
             if not isinstance(devices_data, list):
                 self.shell._append_output("[yellow]No devices found.[/]\n")
@@ -798,11 +869,16 @@ class MonitoringCommandHandler(CommandHandler):
             devices_table.add_column("Mappings", justify="right", width=8)
 
             # Sort devices: online first, then by ID
-            sorted_devices = sorted(devices_data, key=lambda d: (d.get("offline", False), d.get("id", "")))
+            sorted_devices = _sort_devices(devices_data)
+
+            # Summary counters are accumulated while rows are emitted
+            offline_count = 0
 
             for device in sorted_devices:
                 device_id = device.get("id", "unknown") or "unknown"
                 offline = device.get("offline", False)
+                if offline:
+                    offline_count += 1
                 stale = device.get("stale", False)
                 ip = device.get("ip") or ""
                 model = device.get("model_number") or ""
@@ -862,12 +938,8 @@ class MonitoringCommandHandler(CommandHandler):
 
             # Summary
             total = len(sorted_devices)
-            online = sum(1 for d in sorted_devices if not d.get("offline"))
-            offline_count = sum(1 for d in sorted_devices if d.get("offline"))
-
-            self.shell._append_output(f"[dim]Total: {total} devices | ")
-            self.shell._append_output(f"[green]{online} online[/] | ")
-            self.shell._append_output(f"[red]{offline_count} offline[/]\n\n")
+            online = total - offline_count
+            self.shell._append_output(_devices_summary(total, online, offline_count))
 
         except Exception as exc:
             self.shell._append_output(f"[bold red]Error fetching devices:[/] {exc}\n")
@@ -11,24 +11,448 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import re
 import shutil
 import textwrap
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+from itertools import starmap, zip_longest
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import websockets
 from prompt_toolkit.document import Document
 
+from .shell_utils import spawn_task
 from .ui_components import FIELD_DESCRIPTIONS
 
+try:
+    # Optional C-accelerated decoder for the log/event streams and log view responses
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
 if TYPE_CHECKING:
     from prompt_toolkit import Application
     from prompt_toolkit.buffer import Buffer
     from ..shell.core import ArtNetShell
 
 
+# Per-level log tail line templates (timestamp, logger, message), so the
+# WebSocket loop only does a single %-format per message
+_LEVEL_COLORS = {
+    "DEBUG": "\033[36m",    # Cyan
+    "INFO": "\033[32m",     # Green
+    "WARNING": "\033[33m",  # Yellow
+    "ERROR": "\033[31m",    # Red
+    "CRITICAL": "\033[1;31m",  # Bold red
+}
+_LEVEL_TEMPLATES: dict[str, str] = {
+    level: f"\033[2m%s\033[0m {color}{level:<8}\033[0m \033[36m%s\033[0m: %s\n"
+    for level, color in _LEVEL_COLORS.items()
+}
+# Unknown levels: white, with the level itself as a placeholder
+_LEVEL_TEMPLATE_DEFAULT = "\033[2m%s\033[0m \033[37m%-8s\033[0m \033[36m%s\033[0m: %s\n"
+
+# Heartbeat frames as serialized by compact and default JSON encoders
+_PING_PREFIXES = (b'{"type":"ping"', b'{"type": "ping"')
+
+_ANSI_RESET = "\033[0m"
+_ANSI_DIM = "\033[2m"
+_ANSI_MAGENTA = "\033[35m"
+_ANSI_RED = "\033[31m"
+_ANSI_GREEN = "\033[32m"
+_ANSI_YELLOW = "\033[33m"
+_ANSI_BLUE = "\033[34m"
+_ANSI_CYAN = "\033[36m"
+_ANSI_WHITE = "\033[37m"
+
+# Log view table columns that every entry has; anything else is an extra column
+_STANDARD_FIELDS = frozenset(("timestamp", "level", "logger", "message"))
+
+# Log view level column: width and the colored first-line cell for each known level
+_LEVEL_COL_WIDTH = 8
+_LEVEL_CELLS: dict[str, str] = {
+    level: f"{color}{level:<{_LEVEL_COL_WIDTH}.{_LEVEL_COL_WIDTH}}{_ANSI_RESET}"
+    for level, color in _LEVEL_COLORS.items()
+}
+
+# Log view table cell separators (bold cyan box-drawing)
+_COL_SEP = "\033[1;36m│\033[0m "
+_COL_SEP_PADDED = " " + _COL_SEP
+_ROW_END_NL = "\033[1;36m│\033[0m\n"
+
+# Log tail extras lines: "  ╰─► " on the first line, aligned spaces after (6 visible chars)
+_EXTRA_PREFIX = f"{_ANSI_DIM}  ╰─► {_ANSI_RESET}{_ANSI_MAGENTA}"
+_EXTRA_CONTINUATION_PREFIX = f"{_ANSI_DIM}     {_ANSI_RESET}{_ANSI_MAGENTA}"
+_EXTRA_PREFIX_WIDTH = 6
+# Joins wrapped extras lines: close the line, then indent the continuation
+_EXTRA_LINE_BREAK = f"{_ANSI_RESET}\n{_EXTRA_CONTINUATION_PREFIX}"
+
+# Keepalive reply for the events stream, serialized once
+_PONG_MESSAGE = json.dumps({"type": "pong"})
+
+# Events view detail lines under an event header
+_EVENT_DETAIL = f"{_ANSI_DIM}  ╰─► {_ANSI_RESET}"
+_EVENT_DETAIL_CONT = f"{_ANSI_DIM}     {_ANSI_RESET}"
+
+
+# Watch mode refresh header; only the target and timestamp vary per refresh
+_WATCH_HEADER_TMPL = (
+    "\033[1;36m╔" + "═" * 59 + "╗\033[0m\n"
+    "\033[1;36m║  Watch Mode - {target:<43} ║\033[0m\n"
+    "\033[1;36m║  Updated at {ts:<45} ║\033[0m\n"
+    "\033[1;36m╚" + "═" * 59 + "╝\033[0m\n\n"
+)
+
+
+# Static log view screens, built once and reused on every show
+_LOADING_DOC = Document(
+    text=(
+        "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
+        "\033[1;36m║                     Logs View Mode                        ║\033[0m\n"
+        "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
+        "\033[2mLoading logs...\033[0m\n"
+    ),
+    cursor_position=0,
+)
+_NO_LOGS_DOC = Document(
+    text="\033[2mNo logs found matching current filters\033[0m\n",
+    cursor_position=0,
+)
+
+
+# Log view modal overlays; only the input line (and search regex mode) vary
+_FILTER_MODAL_HEADER = (
+    "\n\n"
+    "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
+    "\033[1;36m║                    Logger Filter                          ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[0m║ Enter logger name prefix (e.g., govee.api)                ║\033[0m\n"
+    "\033[0m║ Leave empty to clear filter                               ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+)
+_FILTER_MODAL_FOOTER = (
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[2m║ Enter: Accept  │  Esc: Cancel                             ║\033[0m\n"
+    "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
+)
+_SEARCH_MODAL_HEADER = (
+    "\n\n"
+    "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
+    "\033[1;36m║                    Search Pattern                         ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[0m║ Enter search pattern                                      ║\033[0m\n"
+    "\033[0m║ Leave empty to clear search                               ║\033[0m\n"
+)
+_SEARCH_MODAL_MIDDLE = (
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+)
+_SEARCH_MODAL_FOOTER = (
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[2m║ Enter: Accept  │  Esc: Cancel  │  Ctrl+R: Toggle Regex   ║\033[0m\n"
+    "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
+)
+_HELP_MODAL = (
+    "\n\n"
+    "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
+    "\033[1;36m║                 Logs View - Help                          ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[1;33m║ Navigation:                                               ║\033[0m\n"
+    "\033[0m║   PgUp/PgDn       Previous/Next page                      ║\033[0m\n"
+    "\033[0m║   Home/End        First/Last page                         ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[1;33m║ Filters:                                                  ║\033[0m\n"
+    "\033[0m║   l               Cycle log level filter                  ║\033[0m\n"
+    "\033[0m║                   (INFO→WARNING→ERROR→CRITICAL→ALL)       ║\033[0m\n"
+    "\033[0m║   f               Set logger filter (prefix match)        ║\033[0m\n"
+    "\033[0m║   /               Edit search pattern                     ║\033[0m\n"
+    "\033[0m║   c               Clear logger filter                     ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[1;33m║ Actions:                                                  ║\033[0m\n"
+    "\033[0m║   r               Manual refresh current page             ║\033[0m\n"
+    "\033[0m║   Space           Toggle follow mode (auto-jump to last)  ║\033[0m\n"
+    "\033[0m║   ?               Show this help                          ║\033[0m\n"
+    "\033[0m║   q/Esc           Exit logs view                          ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[1;33m║ Info:                                                     ║\033[0m\n"
+    "\033[0m║   Auto-refresh:   Every 5 seconds                         ║\033[0m\n"
+    "\033[0m║   Follow mode:    OFF by default, toggle with Space       ║\033[0m\n"
+    "\033[0m║   Level filter:   Additive (ERROR shows ERROR+CRITICAL)   ║\033[0m\n"
+    "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
+    "\033[2m║ Press any key to close                                    ║\033[0m\n"
+    "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
+)
+_MODAL_INPUT_LINE = "\033[0m║ {:<57} ║\033[0m\n"
+_REGEX_MODE_LINE = "\033[0m║ Regex mode: {:<44} ║\033[0m\n"
+
+
+# Terminal size is re-queried at most this often; prompt_toolkit owns SIGWINCH
+# while the application runs, so a short TTL stands in for resize notifications
+_TERMINAL_SIZE_TTL = 1.0
+_terminal_size_cache: Optional[tuple[float, os.terminal_size]] = None
+
+
+def _get_terminal_size() -> os.terminal_size:
+    """
+    Get the terminal size, cached for _TERMINAL_SIZE_TTL seconds.
+
+    Returns:
+        Terminal size (falls back to 80x24 when not attached to a terminal)
+    """
+    global _terminal_size_cache
+    now = time.monotonic()
+    if _terminal_size_cache is None or now - _terminal_size_cache[0] > _TERMINAL_SIZE_TTL:
+        _terminal_size_cache = (now, shutil.get_terminal_size(fallback=(80, 24)))
+    return _terminal_size_cache[1]
+
+
+_MONTH_ABBRS = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(iso_timestamp: str) -> str:
+    """
+    Format ISO timestamp to 'Jan 15 14:35:42'.
+
+    Cached since the same rows are re-rendered on every log view refresh.
+
+    Args:
+        iso_timestamp: ISO format timestamp like '2025-01-15T14:35:42.123Z'
+
+    Returns:
+        Formatted timestamp string
+    """
+    # Fast path: slice the fixed-position fields of 'YYYY-MM-DDTHH:MM:SS...'
+    if (
+        len(iso_timestamp) >= 19
+        and iso_timestamp[4] == "-"
+        and iso_timestamp[7] == "-"
+        and iso_timestamp[10] in "T "
+        and iso_timestamp[13] == ":"
+        and iso_timestamp[16] == ":"
+    ):
+        month = iso_timestamp[5:7]
+        if month.isdigit() and 1 <= int(month) <= 12:
+            return f"{_MONTH_ABBRS[int(month)]} {iso_timestamp[8:10]} {iso_timestamp[11:19]}"
+
+    try:
+        # Parse ISO timestamp
+        dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
+        # Format as "Jan 15 14:35:42"
+        return dt.strftime("%b %d %H:%M:%S")
+    except Exception:
+        # Fallback to original if parsing fails
+        return iso_timestamp[:19] if len(iso_timestamp) >= 19 else iso_timestamp
+
+
+# Whitespace that textwrap collapses or treats specially; text containing any
+# of it takes the textwrap path so output stays identical
+_WRAP_SPECIAL_WS = ("  ", "\t", "\n", "\r", "\x0b", "\x0c")
+
+
+@lru_cache(maxsize=64)
+def _text_wrapper(width: int) -> textwrap.TextWrapper:
+    """
+    Get the shared TextWrapper for a column width.
+
+    Column widths only change with the terminal size, so one wrapper per
+    width is reused across rows and renders.
+
+    Args:
+        width: Maximum line width
+
+    Returns:
+        TextWrapper that breaks long words but not on hyphens
+    """
+    return textwrap.TextWrapper(width=width, break_long_words=True, break_on_hyphens=False)
+
+
+def _fast_wrap(text: str, width: int) -> list[str]:
+    """
+    Wrap single-spaced text like textwrap.wrap(break_long_words=True,
+    break_on_hyphens=False) without building a TextWrapper per call.
+
+    Args:
+        text: Text to wrap
+        width: Maximum line width
+
+    Returns:
+        Wrapped lines (empty list for empty text)
+    """
+    if (
+        not text
+        or width < 1
+        or text[0] == " "
+        or text[-1] == " "
+        or any(ws in text for ws in _WRAP_SPECIAL_WS)
+    ):
+        return _text_wrapper(width).wrap(text)
+
+    n = len(text)
+    if n <= width:
+        return [text]
+
+    lines = []
+    i = 0
+    while i < n:
+        j = i + width
+        if j >= n:
+            lines.append(text[i:])
+            break
+        if text[j] == " ":
+            # Line ends exactly on a word boundary
+            lines.append(text[i:j])
+            i = j + 1
+            continue
+        k = text.rfind(" ", i, j)
+        word_end = text.find(" ", j)
+        if word_end == -1:
+            word_end = n
+        if k == -1 or word_end - (k + 1) > width:
+            # Word crossing the edge can't fit on any line; split it here
+            lines.append(text[i:j].rstrip(" "))
+            i = j
+        else:
+            lines.append(text[i:k])
+            i = k + 1
+    return lines
+
+
+def _wrap_text(text: str, width: int) -> list[str]:
+    """Wrap text to fit within width, returning list of lines."""
+    if not text:
+        return [""]
+    # Slice-based wrapper; short single-spaced fields come back unwrapped
+    wrapped = _fast_wrap(text, width)
+    return wrapped if wrapped else [""]
+
+
+def _make_row_formatter(
+    extra_field_names: list[str],
+    widths: tuple[int, int, int, int],
+    extra_field_width: int,
+) -> Callable[[dict], tuple[int, str]]:
+    """
+    Build the log view row formatter for one page layout.
+
+    Everything that is constant for the page (widths, cell formats and the
+    first/continuation line templates) is bound once as closure variables.
+
+    Args:
+        extra_field_names: Sorted extra field column names
+        widths: Timestamp, level, logger and message column widths
+        extra_field_width: Width of each extra field column
+
+    Returns:
+        Function rendering a log entry to (number of screen lines, lines)
+    """
+    timestamp_width, level_width, logger_width, message_width = widths
+
+    # Truncate-and-pad cell formats for this page's column widths
+    format_level = f"{{:<{level_width}.{level_width}}}".format
+    logger_cell = f"{{:<{logger_width}.{logger_width}}}"
+    # Logger, message and extra cells, shared by first and continuation lines
+    body_template = (
+        f"{{:<{message_width}.{message_width}}} "
+        + f"{_COL_SEP}{{:<{extra_field_width}.{extra_field_width}}} " * len(extra_field_names)
+        + _ROW_END_NL
+    )
+
+    # Line templates filled positionally: timestamp, level cell, logger,
+    # message, then one value per extra field. Continuation lines leave
+    # timestamp and level empty and only the first line is colored.
+    format_first_line = (
+        f"{_COL_SEP}{_ANSI_DIM}{{:<{timestamp_width}.{timestamp_width}}}{_ANSI_RESET}"
+        f"{_COL_SEP_PADDED}{{}}"
+        f"{_COL_SEP_PADDED}{_ANSI_CYAN}{logger_cell}{_ANSI_RESET}"
+        f"{_COL_SEP_PADDED}{body_template}"
+    ).format
+    format_continuation_line = (
+        f"{_COL_SEP}{'':<{timestamp_width}}{_COL_SEP_PADDED}{'':<{level_width}}"
+        f"{_COL_SEP_PADDED}{logger_cell}"
+        f"{_COL_SEP_PADDED}{body_template}"
+    ).format
+
+    def format_row(log_entry: dict) -> tuple[int, str]:
+        """
+        Render one log entry as table lines.
+
+        Long logger, message and extra field values wrap onto continuation
+        lines; timestamp, level and logger are only colored on the first line.
+        """
+        # Missing fields are rendered as defaults, so bind the lookup once
+        get = log_entry.get
+
+        # Format timestamp: ISO to "Jan 15 14:35:42"
+        formatted_time = _format_timestamp(get("timestamp", ""))
+        level = get("level", "INFO")
+
+        # Wrap fields that might be long
+        logger_lines = _wrap_text(get("logger", ""), logger_width)
+        message_lines = _wrap_text(get("message", ""), message_width)
+        extra_lines = [
+            _wrap_text(str(get(field_name, "")), extra_field_width)
+            for field_name in extra_field_names
+        ]
+        max_lines = max(len(logger_lines), len(message_lines), *map(len, extra_lines))
+
+        # Color code by level
+        level_cell = _LEVEL_CELLS.get(level) or f"{_ANSI_WHITE}{format_level(level)}{_ANSI_RESET}"
+
+        # One tuple of cells per screen line; shorter columns pad with blanks
+        line_cells = zip_longest(logger_lines, message_lines, *extra_lines, fillvalue="")
+        lines = [format_first_line(formatted_time, level_cell, *next(line_cells))]
+        lines.extend(starmap(format_continuation_line, line_cells))
+
+        return max_lines, "".join(lines)
+
+    return format_row
+
+
+def _render_rows(
+    logs: list[dict],
+    extra_field_names: list[str],
+    widths: tuple[int, int, int, int],
+    extra_field_width: int,
+    max_content_lines: int,
+) -> str:
+    """
+    Render the log view table's data rows.
+
+    Kept free of controller state so the hot per-row loop stays a plain,
+    fully annotated function.
+
+    Args:
+        logs: Log entries for the current page
+        extra_field_names: Sorted extra field column names
+        widths: Timestamp, level, logger and message column widths
+        extra_field_width: Width of each extra field column
+        max_content_lines: Screen lines available for rows; entries that
+            would overflow it are not rendered
+
+    Returns:
+        Rendered rows, one or more lines per entry
+    """
+    parts: list[str] = []
+    lines_rendered = 0
+
+    # Rows are formatted lazily so nothing past the screen budget is built
+    format_row = _make_row_formatter(extra_field_names, widths, extra_field_width)
+    for line_count, row in map(format_row, logs):
+        # Stop at the first entry that would overflow the available lines
+        if lines_rendered + line_count > max_content_lines:
+            break
+        parts.append(row)
+        lines_rendered += line_count
+
+    return "".join(parts)
+
+
 class ConnectionState(Enum):
     """WebSocket connection states for log tailing."""
     DISCONNECTED = "disconnected"
@@ -37,6 +461,43 @@ class ConnectionState(Enum):
     RECONNECTING = "reconnecting"
 
 
+class _CoalescedInvalidator:
+    """
+    Fold repeated redraw requests into a single app.invalidate().
+
+    Calls made within the same event loop iteration schedule one invalidate
+    via call_soon; further calls are ignored until it has run.
+    """
+
+    def __init__(self, app: Application):
+        """
+        Initialize the invalidator.
+
+        Args:
+            app: The prompt_toolkit Application instance
+        """
+        self.app = app
+        self._pending = False
+
+    def __call__(self) -> None:
+        """Request a redraw, coalescing with any already pending request."""
+        if self._pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop (called from synchronous code) - redraw directly
+            self.app.invalidate()
+            return
+        self._pending = True
+        loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Perform the pending redraw."""
+        self._pending = False
+        self.app.invalidate()
+
+
 class LogTailController:
     """
     Controller for real-time log tailing via WebSocket.
@@ -52,7 +513,10 @@ class LogTailController:
 
     # Performance tuning
     MAX_BUFFER_CHARS = 500_000  # ~500KB of log text
-    BATCH_INTERVAL = 0.1  # 100ms batching interval
+    TRIM_SLACK_CHARS = 50_000  # Overflow tolerated before trimming back to MAX_BUFFER_CHARS
+    MIN_FLUSH_INTERVAL = 0.05  # Redraw ceiling (20Hz); lines arriving faster are batched
+    RAW_QUEUE_SIZE = 1024  # Decoded messages buffered between reader and formatter
+    MAX_PENDING_LINES = 10_000  # Formatted lines held between flushes; oldest dropped beyond this
     MAX_RECONNECT_DELAY = 10.0  # Max backoff delay
 
     def __init__(self, app: Application, log_buffer: Buffer, server_url: str):
@@ -65,6 +529,7 @@ class LogTailController:
             server_url: Base HTTP server URL (will be converted to WebSocket)
         """
         self.app = app
+        self._coalesced_invalidate = _CoalescedInvalidator(app)
         self.log_buffer = log_buffer
         self.server_url = server_url
 
@@ -73,17 +538,34 @@ class LogTailController:
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.ws_task: Optional[asyncio.Task] = None
         self.batch_task: Optional[asyncio.Task] = None
+        self.format_task: Optional[asyncio.Task] = None
 
         # Filter state
         self.level_filter: Optional[str] = None
         self.logger_filter: Optional[str] = None
+        # JSON filter message sent on (re)connect; None when no filters are set
+        self._filter_payload: Optional[str] = None
 
         # Follow-tail mode (auto-scroll to newest)
         self.follow_tail = True
 
-        # Pending log lines for batched updates
-        self._pending_lines: deque[str] = deque()
-        self._lock = asyncio.Lock()
+        # Decoded messages waiting to be formatted; the reader drops (and
+        # counts) messages rather than blocking when this is full
+        self._raw_queue: asyncio.Queue = asyncio.Queue(maxsize=self.RAW_QUEUE_SIZE)
+        self._dropped_messages = 0
+
+        # Pending log lines for batched updates. Producer and consumer share the
+        # event loop thread, so the batch loop just swaps in a fresh deque. The
+        # deque discards its oldest lines if flushing stalls; those are counted.
+        self._pending_lines: deque[str] = deque(maxlen=self.MAX_PENDING_LINES)
+        self._dropped_lines = 0
+        # Set when a line lands in an empty pending queue
+        self._wake = asyncio.Event()
+
+        # Buffer contents as whole entries, so trimming evicts from the front
+        # instead of scanning and slicing the full text
+        self._line_ring: deque[str] = deque()
+        self._ring_chars = 0
 
         # Reconnection state
         self._reconnect_delay = 1.0
@@ -113,13 +595,22 @@ class LogTailController:
 
         self.level_filter = level
         self.logger_filter = logger
+        self._filter_payload = self._build_filter_payload()
         self._should_reconnect = True
         self._reconnect_delay = 1.0
 
+        # Seed the line ring with whatever is already shown (e.g. the mode banner)
+        current_text = self.log_buffer.text
+        self._line_ring = deque([current_text]) if current_text else deque()
+        self._ring_chars = len(current_text)
+
         # Start WebSocket connection task
+        self._raw_queue = asyncio.Queue(maxsize=self.RAW_QUEUE_SIZE)
+        self._dropped_messages = 0
         self.ws_task = asyncio.create_task(self._ws_loop())
 
-        # Start UI batch update task
+        # Start formatter and UI batch update tasks
+        self.format_task = asyncio.create_task(self._format_loop())
         self.batch_task = asyncio.create_task(self._batch_update_loop())
 
     async def stop(self) -> None:
@@ -134,12 +625,13 @@ class LogTailController:
             except asyncio.CancelledError:
                 pass
 
-        if self.batch_task and not self.batch_task.done():
-            self.batch_task.cancel()
-            try:
-                await self.batch_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self.format_task, self.batch_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         # Close WebSocket
         if self.websocket:
@@ -148,6 +640,7 @@ class LogTailController:
 
         self.state = ConnectionState.DISCONNECTED
         self.ws_task = None
+        self.format_task = None
         self.batch_task = None
 
     async def set_filters(self, level: Optional[str] = None, logger: Optional[str] = None) -> None:
@@ -158,22 +651,38 @@ class LogTailController:
             level: Log level filter (None to clear)
             logger: Logger name filter (None to clear)
         """
+        # The server already has these filters (sent on connect or last change)
+        if level == self.level_filter and logger == self.logger_filter:
+            return
+
         self.level_filter = level
         self.logger_filter = logger
+        self._filter_payload = self._build_filter_payload()
 
         # Send filter update to WebSocket if connected
         if self.websocket and self.state == ConnectionState.CONNECTED:
             try:
-                filters = {}
-                if level:
-                    filters["level"] = level
-                if logger:
-                    filters["logger"] = logger
-
-                await self.websocket.send(json.dumps(filters))
+                # An empty object clears the server-side filters
+                await self.websocket.send(self._filter_payload or "{}")
             except Exception:
                 pass  # Will reconnect if needed
 
+    def _build_filter_payload(self) -> Optional[str]:
+        """
+        Encode the current filters as the JSON message the server expects.
+
+        Returns:
+            JSON string, or None if no filters are set
+        """
+        if not (self.level_filter or self.logger_filter):
+            return None
+        filters = {}
+        if self.level_filter:
+            filters["level"] = self.level_filter
+        if self.logger_filter:
+            filters["logger"] = self.logger_filter
+        return json.dumps(filters)
+
     async def clear_filters(self) -> None:
         """Clear all filters."""
         await self.set_filters(level=None, logger=None)
@@ -185,7 +694,51 @@ class LogTailController:
         Args:
             line: Formatted log line to append
         """
-        self._pending_lines.append(line)
+        pending = self._pending_lines
+        if len(pending) == self.MAX_PENDING_LINES:
+            self._dropped_lines += 1
+        pending.append(line)
+        if len(pending) == 1:
+            self._wake.set()
+
+    def append_log_lines(self, lines: list[str]) -> None:
+        """
+        Append several log lines to the pending queue in one step.
+
+        Args:
+            lines: Formatted log lines to append
+        """
+        if not lines:
+            return
+        pending = self._pending_lines
+        was_empty = not pending
+        overflow = len(pending) + len(lines) - self.MAX_PENDING_LINES
+        if overflow > 0:
+            self._dropped_lines += overflow
+        pending.extend(lines)
+        if was_empty:
+            self._wake.set()
+
+    def append_notice(self, text: str) -> None:
+        """
+        Append text to the log buffer immediately, bypassing batching.
+
+        Args:
+            text: Text to append
+        """
+        self._line_ring.append(text)
+        self._ring_chars += len(text)
+        new_text = self.log_buffer.text + text
+        if self.follow_tail:
+            cursor_pos = len(new_text)
+            if new_text.endswith('\n'):
+                cursor_pos = max(0, len(new_text) - 1)
+        else:
+            cursor_pos = self.log_buffer.cursor_position
+        self.log_buffer.set_document(
+            Document(text=new_text, cursor_position=cursor_pos),
+            bypass_readonly=True
+        )
 
     def toggle_follow_tail(self) -> bool:
         """
@@ -210,111 +763,58 @@ class LogTailController:
         while self._should_reconnect:
             try:
                 self.state = ConnectionState.CONNECTING
-                self.app.invalidate()
+                self._coalesced_invalidate()
 
-                # Connect to WebSocket
+                # Connect to WebSocket. The log stream is a LAN firehose where CPU
+                # is the bottleneck, so skip per-message deflate, and cap the
+                # receive queue so a slow client pushes back on the server.
                 async with websockets.connect(
                     self.ws_url,
                     ping_interval=20,
                     ping_timeout=10,
+                    compression=None,
+                    max_size=2**20,
+                    max_queue=256,
                 ) as websocket:
                     self.websocket = websocket
                     self.state = ConnectionState.CONNECTED
                     self._reconnect_delay = 1.0  # Reset backoff on successful connect
-                    self.app.invalidate()
+                    self._coalesced_invalidate()
 
                     # Send initial filters if set
-                    if self.level_filter or self.logger_filter:
-                        filters = {}
-                        if self.level_filter:
-                            filters["level"] = self.level_filter
-                        if self.logger_filter:
-                            filters["logger"] = self.logger_filter
-                        await websocket.send(json.dumps(filters))
-
-                    # Receive and process log messages
-                    async for message in websocket:
+                    if self._filter_payload:
+                        await websocket.send(self._filter_payload)
+
+                    # Receive and decode log messages; formatting happens in
+                    # _format_loop so a slow render never stalls the socket.
+                    # Frames are taken as raw bytes: the JSON decoder validates
+                    # UTF-8 itself, so websockets' str decode is a wasted pass.
+                    loads = _json_loads
+                    raw_queue = self._raw_queue
+                    recv = websocket.recv
+                    while True:
                         try:
-                            data = json.loads(message)
+                            message = await recv(decode=False)
+                        except websockets.ConnectionClosedOK:
+                            break
 
-                            # Skip ping messages
-                            if data.get("type") == "ping":
-                                continue
+                        # Cheap prefix check skips the JSON parser for heartbeats
+                        if message.startswith(_PING_PREFIXES):
+                            continue
 
-                            # Format log entry
-                            timestamp = data.get("timestamp", "")
-                            level = data.get("level", "INFO")
-                            logger_name = data.get("logger", "")
-                            message_text = data.get("message", "")
-                            extra = data.get("extra", {})
-
-                            # Format with colors (ANSI codes)
-                            # Timestamp: dim white
-                            # Level: color-coded
-                            # Logger: cyan
-                            # Message: default
-                            level_colors = {
-                                "DEBUG": "\033[36m",    # Cyan
-                                "INFO": "\033[32m",     # Green
-                                "WARNING": "\033[33m",  # Yellow
-                                "ERROR": "\033[31m",    # Red
-                                "CRITICAL": "\033[1;31m",  # Bold red
-                            }
-                            level_color = level_colors.get(level, "\033[37m")
-                            reset = "\033[0m"
-                            dim = "\033[2m"
-                            cyan = "\033[36m"
-                            magenta = "\033[35m"
-
-                            formatted_line = (
-                                f"{dim}{timestamp}{reset} "
-                                f"{level_color}{level:<8}{reset} "
-                                f"{cyan}{logger_name}{reset}: "
-                                f"{message_text}\n"
-                            )
-
-                            # Add extras on a second line with visual connection
-                            if extra and isinstance(extra, dict):
-                                # Format extras as key=value pairs
-                                extra_items = [f"{k}={v}" for k, v in extra.items()]
-                                extra_text = " ".join(extra_items)
-
-                                # Get terminal width for wrapping
-                                terminal_width = shutil.get_terminal_size(fallback=(80, 24)).columns
-
-                                # Prefix for extra lines: "  ╰─► " (6 visible chars)
-                                prefix = f"{dim}  ╰─► {reset}"
-                                # Continuation prefix for wrapped lines: "     " (5 spaces for alignment)
-                                continuation_prefix = f"{dim}     {reset}"
-
-                                # Calculate available width for text (account for prefix and some margin)
-                                prefix_width = 6  # "  ╰─► "
-                                available_width = max(40, terminal_width - prefix_width - 2)  # -2 for safety margin
-
-                                # Wrap the extra text
-                                wrapped_lines = textwrap.wrap(
-                                    extra_text,
-                                    width=available_width,
-                                    break_long_words=True,
-                                    break_on_hyphens=False
-                                )
-
-                                # Add wrapped lines with proper indentation
-                                for i, line in enumerate(wrapped_lines):
-                                    if i == 0:
-                                        # First line uses the arrow prefix
-                                        formatted_line += f"{prefix}{magenta}{line}{reset}\n"
-                                    else:
-                                        # Continuation lines use aligned spacing
-                                        formatted_line += f"{continuation_prefix}{magenta}{line}{reset}\n"
-
-                            self.append_log_line(formatted_line)
-
-                        except json.JSONDecodeError:
+                        try:
+                            data = loads(message)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
                             continue
-                        except Exception as exc:
-                            # Log parsing errors shouldn't crash the loop
-                            self.append_log_line(f"\033[31mError parsing log: {exc}\033[0m\n")
+
+                        # Skip ping messages with other key orderings
+                        if isinstance(data, dict) and data.get("type") == "ping":
+                            continue
+
+                        try:
+                            raw_queue.put_nowait(data)
+                        except asyncio.QueueFull:
+                            self._dropped_messages += 1
 
             except asyncio.CancelledError:
                 break
@@ -323,7 +823,7 @@ class LogTailController:
                 if self._should_reconnect:
                     self.state = ConnectionState.RECONNECTING
                     self.websocket = None
-                    self.app.invalidate()
+                    self._coalesced_invalidate()
 
                     # Exponential backoff: 1s -> 2s -> 4s -> 8s -> 10s (max)
                     await asyncio.sleep(self._reconnect_delay)
@@ -333,36 +833,158 @@ class LogTailController:
 
         self.state = ConnectionState.DISCONNECTED
         self.websocket = None
-        self.app.invalidate()
+        self._coalesced_invalidate()
+
+    def _format_log_entry(self, data: dict) -> str:
+        """
+        Format a decoded log message as ANSI-colored text.
+
+        Args:
+            data: Log message from the WebSocket stream
+
+        Returns:
+            Formatted line(s), newline-terminated
+        """
+        # Format log entry
+        timestamp = data.get("timestamp", "")
+        level = data.get("level", "INFO")
+        logger_name = data.get("logger", "")
+        message_text = data.get("message", "")
+        extra = data.get("extra")
+
+        # Format with colors (ANSI codes)
+        # Timestamp: dim white
+        # Level: color-coded
+        # Logger: cyan
+        # Message: default
+        template = _LEVEL_TEMPLATES.get(level)
+        if template is not None:
+            formatted_line = template % (timestamp, logger_name, message_text)
+        else:
+            formatted_line = _LEVEL_TEMPLATE_DEFAULT % (
+                timestamp, level, logger_name, message_text
+            )
+
+        # Add extras on a second line with visual connection
+        if extra and isinstance(extra, dict):
+            # Format extras as key=value pairs
+            extra_items = [f"{k}={v}" for k, v in extra.items()]
+            extra_text = " ".join(extra_items)
+
+            # Get terminal width for wrapping (cached; see _get_terminal_size)
+            terminal_width = _get_terminal_size().columns
+
+            # Calculate available width for text (account for prefix and some margin)
+            available_width = max(40, terminal_width - _EXTRA_PREFIX_WIDTH - 2)  # -2 for safety margin
+
+            # Wrap the extra text (usually a single line)
+            wrapped_lines = _fast_wrap(extra_text, available_width)
+
+            # First line uses the arrow prefix, continuation lines aligned spacing
+            if wrapped_lines:
+                formatted_line = (
+                    f"{formatted_line}{_EXTRA_PREFIX}"
+                    f"{_EXTRA_LINE_BREAK.join(wrapped_lines)}{_ANSI_RESET}\n"
+                )
+
+        return formatted_line
+
+    async def _format_loop(self) -> None:
+        """Drain decoded messages from the reader and queue formatted lines.
+
+        Each wakeup takes everything already queued, so a burst costs one
+        await and one append_log_lines() call instead of one per message.
+        """
+        raw_queue = self._raw_queue
+        format_entry = self._format_log_entry
+        last_drop_report = 0.0
+        try:
+            while True:
+                batch = [await raw_queue.get()]
+                while True:
+                    try:
+                        batch.append(raw_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                lines = []
+                for data in batch:
+                    try:
+                        lines.append(format_entry(data))
+                    except Exception as exc:
+                        # Log parsing errors shouldn't crash the loop
+                        lines.append(f"\033[31mError parsing log: {exc}\033[0m\n")
+
+                # Surface reader drops at most once per second, or once caught up
+                if self._dropped_messages:
+                    now = time.monotonic()
+                    if raw_queue.empty() or now - last_drop_report >= 1.0:
+                        lines.append(
+                            f"\033[33m[{self._dropped_messages} log message(s) dropped - "
+                            f"display is falling behind]\033[0m\n"
+                        )
+                        self._dropped_messages = 0
+                        last_drop_report = now
+
+                self.append_log_lines(lines)
+        except asyncio.CancelledError:
+            pass
 
     async def _batch_update_loop(self) -> None:
-        """Batch UI updates every BATCH_INTERVAL to reduce redraw frequency."""
+        """
+        Batch UI updates to reduce redraw frequency.
+
+        Sleeps until a line is pending and flushes right away, but never more
+        often than every MIN_FLUSH_INTERVAL: an isolated line shows up at once,
+        while a burst keeps queueing during the wait and lands in one update.
+        """
+        last_flush = 0.0
         try:
             while True:
-                await asyncio.sleep(self.BATCH_INTERVAL)
+                # Idle until the first pending line arrives
+                await self._wake.wait()
+                self._wake.clear()
+
+                # Flushed recently: let the burst accumulate until the ceiling allows
+                since_flush = time.monotonic() - last_flush
+                if since_flush < self.MIN_FLUSH_INTERVAL:
+                    await asyncio.sleep(self.MIN_FLUSH_INTERVAL - since_flush)
+                    self._wake.clear()
+                last_flush = time.monotonic()
 
                 if self._pending_lines:
-                    async with self._lock:
-                        # Collect all pending lines
-                        lines_to_add = "".join(self._pending_lines)
-                        self._pending_lines.clear()
+                    # Collect all pending lines
+                    batch, self._pending_lines = (
+                        self._pending_lines, deque(maxlen=self.MAX_PENDING_LINES)
+                    )
+                    if self._dropped_lines:
+                        # Mark the gap left by lines discarded while flushing stalled
+                        batch = [
+                            f"\033[33m[{self._dropped_lines} log line(s) dropped - "
+                            f"display is falling behind]\033[0m\n",
+                            *batch,
+                        ]
+                        self._dropped_lines = 0
+                    lines_to_add = "".join(batch)
 
                     # Append to buffer
                     if lines_to_add:
-                        # Get current buffer text
-                        current_text = self.log_buffer.text
-                        new_text = current_text + lines_to_add
-
-                        # Trim buffer if exceeding max size
-                        if len(new_text) > self.MAX_BUFFER_CHARS:
-                            # Keep only the last MAX_BUFFER_CHARS characters
-                            # Try to cut at a newline boundary
-                            trim_point = len(new_text) - self.MAX_BUFFER_CHARS
-                            newline_pos = new_text.find('\n', trim_point)
-                            if newline_pos != -1:
-                                new_text = new_text[newline_pos + 1:]
-                            else:
-                                new_text = new_text[trim_point:]
+                        ring = self._line_ring
+                        ring.extend(batch)
+                        self._ring_chars += len(lines_to_add)
+                        trimmed_chars = 0
+
+                        # Trim buffer once it overflows by more than the slack, so
+                        # steady-state ticks only pay for the append. Whole entries
+                        # are evicted from the front until back under MAX_BUFFER_CHARS.
+                        if self._ring_chars > self.MAX_BUFFER_CHARS + self.TRIM_SLACK_CHARS:
+                            while self._ring_chars > self.MAX_BUFFER_CHARS and len(ring) > 1:
+                                evicted = len(ring.popleft())
+                                self._ring_chars -= evicted
+                                trimmed_chars += evicted
+                            new_text = "".join(ring)
+                        else:
+                            new_text = self.log_buffer.text + lines_to_add
 
                         # Update buffer
                         # Calculate cursor position, avoiding empty line at bottom if text ends with newline
@@ -371,7 +993,8 @@ class LogTailController:
                             if new_text and new_text.endswith('\n'):
                                 cursor_pos = max(0, len(new_text) - 1)
                         else:
-                            cursor_pos = self.log_buffer.cursor_position
+                            # Keep the view on the same line after a trim
+                            cursor_pos = max(0, self.log_buffer.cursor_position - trimmed_chars)
 
                         self.log_buffer.set_document(
                             Document(text=new_text, cursor_position=cursor_pos),
@@ -379,7 +1002,7 @@ class LogTailController:
                         )
 
                         # Invalidate UI
-                        self.app.invalidate()
+                        self._coalesced_invalidate()
 
         except asyncio.CancelledError:
             pass
@@ -400,7 +1023,9 @@ class EventsController:
 
     # Performance tuning
     MAX_BUFFER_CHARS = 500_000  # ~500KB of event text
-    BATCH_INTERVAL = 0.1  # 100ms batching interval
+    TRIM_SLACK_CHARS = 50_000  # Overflow tolerated before trimming back to MAX_BUFFER_CHARS
+    MIN_FLUSH_INTERVAL = 0.05  # Redraw ceiling (20Hz); events arriving faster are batched
+    MAX_PENDING_LINES = 10_000  # Event lines held between flushes; oldest dropped beyond this
     MAX_RECONNECT_DELAY = 10.0  # Max backoff delay
 
     def __init__(self, app: Application, events_buffer: Buffer, server_url: str, shell: ArtNetShell):
@@ -430,9 +1055,18 @@ class EventsController:
         # Follow-tail mode (auto-scroll to newest)
         self.follow_tail = True
 
-        # Pending event lines for batched updates
-        self._pending_lines: deque[str] = deque()
-        self._lock = asyncio.Lock()
+        # Pending event lines for batched updates. Producer and consumer share
+        # the event loop thread, so the batch loop just swaps in a fresh deque.
+        # The deque discards its oldest lines if flushing stalls; those are counted.
+        self._pending_lines: deque[str] = deque(maxlen=self.MAX_PENDING_LINES)
+        self._dropped_lines = 0
+        # Set when a line lands in an empty pending queue
+        self._wake = asyncio.Event()
+
+        # Buffer contents as whole entries, so trimming evicts from the front
+        # instead of scanning and slicing the full text
+        self._line_ring: deque[str] = deque()
+        self._ring_chars = 0
 
         # Reconnection state
         self._reconnect_delay = 1.0
@@ -466,6 +1100,11 @@ class EventsController:
         self._should_reconnect = True
         self._reconnect_delay = 1.0
 
+        # Seed the line ring with whatever is already shown
+        current_text = self.events_buffer.text
+        self._line_ring = deque([current_text]) if current_text else deque()
+        self._ring_chars = len(current_text)
+
         # Start WebSocket connection task
         self.ws_task = asyncio.create_task(self._ws_loop())
 
@@ -507,7 +1146,41 @@ class EventsController:
         Args:
             line: Formatted event line to append
         """
-        self._pending_lines.append(line)
+        pending = self._pending_lines
+        if len(pending) == self.MAX_PENDING_LINES:
+            self._dropped_lines += 1
+        pending.append(line)
+        if len(pending) == 1:
+            self._wake.set()
+
+    def reset_buffer(self, text: str) -> None:
+        """
+        Replace the events buffer contents, e.g. with the events mode banner.
+
+        Args:
+            text: New buffer text
+        """
+        self._line_ring = deque([text]) if text else deque()
+        self._ring_chars = len(text)
+        self.events_buffer.set_document(
+            Document(text=text, cursor_position=len(text)),
+            bypass_readonly=True
+        )
+
+    def append_notice(self, text: str) -> None:
+        """
+        Append text to the events buffer immediately, bypassing batching.
+
+        Args:
+            text: Text to append
+        """
+        self._line_ring.append(text)
+        self._ring_chars += len(text)
+        new_text = self.events_buffer.text + text
+        self.events_buffer.set_document(
+            Document(text=new_text, cursor_position=len(new_text)),
+            bypass_readonly=True
+        )
 
     def toggle_follow_tail(self) -> bool:
         """
@@ -706,21 +1379,13 @@ class EventsController:
         """
         # Parse timestamp for display
         try:
-            from datetime import datetime
             dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
             time_str = dt.strftime("%m/%d %H:%M:%S")
         except Exception:
             time_str = timestamp[:19]  # Fallback to truncated timestamp
 
-        # ANSI colors
-        reset = "\033[0m"
-        dim = "\033[2m"
-        cyan = "\033[36m"
-        green = "\033[32m"
-        yellow = "\033[33m"
-        red = "\033[31m"
-        blue = "\033[34m"
-        magenta = "\033[35m"
+        # Event header prefix: dim "[time]"
+        stamp = f"{_ANSI_DIM}[{time_str}]{_ANSI_RESET}"
 
         if event_type == "device_discovered":
             device_id = data.get("device_id", "unknown")
@@ -733,23 +1398,23 @@ class EventsController:
             self._update_device_cache(device_id, data)
 
             new_marker = " [NEW]" if is_new else ""
-            formatted = f"{dim}[{time_str}]{reset} 🔵 {cyan}Device Discovered{new_marker}{reset}\n"
-            formatted += f"{dim}  ╰─► {reset}ID: {device_id}\n"
+            formatted = f"{stamp} 🔵 {_ANSI_CYAN}Device Discovered{new_marker}{_ANSI_RESET}\n"
+            formatted += f"{_EVENT_DETAIL}ID: {device_id}\n"
             if ip:
-                formatted += f"{dim}     {reset}IP: {ip}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}IP: {ip}\n"
             if model:
-                formatted += f"{dim}     {reset}Model: {model}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}Model: {model}\n"
             if device_type:
-                formatted += f"{dim}     {reset}Type: {device_type}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}Type: {device_type}\n"
             return formatted
 
         elif event_type == "device_online":
             device_id = data.get("device_id", "unknown")
             reason = data.get("previous_offline_reason", "")
 
-            formatted = f"{dim}[{time_str}]{reset} 🟢 {green}Device Online:{reset} {device_id}\n"
+            formatted = f"{stamp} 🟢 {_ANSI_GREEN}Device Online:{_ANSI_RESET} {device_id}\n"
             if reason:
-                formatted += f"{dim}  ╰─► {reset}Previous offline reason: {reason}\n"
+                formatted += f"{_EVENT_DETAIL}Previous offline reason: {reason}\n"
             return formatted
 
         elif event_type == "device_offline":
@@ -757,10 +1422,10 @@ class EventsController:
             reason = data.get("reason", "unknown")
             failures = data.get("failure_count", 0)
 
-            formatted = f"{dim}[{time_str}]{reset} 🔴 {red}Device Offline:{reset} {device_id}\n"
-            formatted += f"{dim}  ╰─► {reset}Reason: {reason}\n"
+            formatted = f"{stamp} 🔴 {_ANSI_RED}Device Offline:{_ANSI_RESET} {device_id}\n"
+            formatted += f"{_EVENT_DETAIL}Reason: {reason}\n"
             if failures:
-                formatted += f"{dim}     {reset}Failures: {failures}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}Failures: {failures}\n"
             return formatted
 
         elif event_type == "device_updated":
@@ -769,10 +1434,10 @@ class EventsController:
             ip = data.get("ip", "")
 
             fields_str = ", ".join(changed_fields) if changed_fields else "unknown"
-            formatted = f"{dim}[{time_str}]{reset} 🔵 {cyan}Device Updated:{reset} {device_id}\n"
-            formatted += f"{dim}  ╰─► {reset}Changed: {fields_str}\n"
+            formatted = f"{stamp} 🔵 {_ANSI_CYAN}Device Updated:{_ANSI_RESET} {device_id}\n"
+            formatted += f"{_EVENT_DETAIL}Changed: {fields_str}\n"
             if ip:
-                formatted += f"{dim}     {reset}IP: {ip}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}IP: {ip}\n"
             return formatted
 
         elif event_type == "mapping_created":
@@ -782,17 +1447,17 @@ class EventsController:
             field = data.get("field")
             fields = data.get("fields", [])
 
-            formatted = f"{dim}[{time_str}]{reset} ⚙️  {blue}Mapping Created{reset}\n"
-            formatted += f"{dim}  ╰─► {reset}ID: {mapping_id}\n"
-            formatted += f"{dim}     {reset}Universe: {universe}, Channel: {channel}\n"
+            formatted = f"{stamp} ⚙️  {_ANSI_BLUE}Mapping Created{_ANSI_RESET}\n"
+            formatted += f"{_EVENT_DETAIL}ID: {mapping_id}\n"
+            formatted += f"{_EVENT_DETAIL_CONT}Universe: {universe}, Channel: {channel}\n"
 
             # Add field information if available
             if field:
                 pretty_field = FIELD_DESCRIPTIONS.get(field, field.capitalize())
-                formatted += f"{dim}     {reset}Field: {pretty_field}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}Field: {pretty_field}\n"
             elif fields:
                 pretty_fields = [FIELD_DESCRIPTIONS.get(f, f.capitalize()) for f in fields]
-                formatted += f"{dim}     {reset}Fields: {', '.join(pretty_fields)}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}Fields: {', '.join(pretty_fields)}\n"
 
             return formatted
 
@@ -801,14 +1466,14 @@ class EventsController:
             changed_fields = data.get("changed_fields", [])
 
             fields_str = ", ".join(changed_fields) if changed_fields else "unknown"
-            formatted = f"{dim}[{time_str}]{reset} ⚙️  {blue}Mapping Updated:{reset} ID {mapping_id}\n"
-            formatted += f"{dim}  ╰─► {reset}Changed: {fields_str}\n"
+            formatted = f"{stamp} ⚙️  {_ANSI_BLUE}Mapping Updated:{_ANSI_RESET} ID {mapping_id}\n"
+            formatted += f"{_EVENT_DETAIL}Changed: {fields_str}\n"
             return formatted
 
         elif event_type == "mapping_deleted":
             mapping_id = data.get("mapping_id", "?")
 
-            formatted = f"{dim}[{time_str}]{reset} ⚙️  {yellow}Mapping Deleted:{reset} ID {mapping_id}\n"
+            formatted = f"{stamp} ⚙️  {_ANSI_YELLOW}Mapping Deleted:{_ANSI_RESET} ID {mapping_id}\n"
             return formatted
 
         elif event_type == "health_status_changed":
@@ -819,32 +1484,32 @@ class EventsController:
 
             # Choose color and icon based on status
             if status == "ok":
-                color = green
+                color = _ANSI_GREEN
                 icon = "🟢"
             elif status == "degraded":
-                color = yellow
+                color = _ANSI_YELLOW
                 icon = "🟡"
             elif status == "suppressed":
-                color = red
+                color = _ANSI_RED
                 icon = "🔴"
             elif status == "recovering":
-                color = cyan
+                color = _ANSI_CYAN
                 icon = "🔵"
             else:
-                color = reset
+                color = _ANSI_RESET
                 icon = "⚪"
 
-            formatted = f"{dim}[{time_str}]{reset} {icon} {color}Health Status Changed{reset}\n"
-            formatted += f"{dim}  ╰─► {reset}Subsystem: {subsystem}\n"
-            formatted += f"{dim}     {reset}Status: {previous} → {status}\n"
+            formatted = f"{stamp} {icon} {color}Health Status Changed{_ANSI_RESET}\n"
+            formatted += f"{_EVENT_DETAIL}Subsystem: {subsystem}\n"
+            formatted += f"{_EVENT_DETAIL_CONT}Status: {previous} → {status}\n"
             if failures is not None:
-                formatted += f"{dim}     {reset}Failures: {failures}\n"
+                formatted += f"{_EVENT_DETAIL_CONT}Failures: {failures}\n"
             return formatted
 
         # Default format for unknown event types
-        formatted = f"{dim}[{time_str}]{reset} ⚪ {event_type}\n"
+        formatted = f"{stamp} ⚪ {event_type}\n"
         for key, value in data.items():
-            formatted += f"{dim}  ╰─► {reset}{key}: {value}\n"
+            formatted += f"{_EVENT_DETAIL}{key}: {value}\n"
         return formatted
 
     async def _ws_loop(self) -> None:
@@ -865,14 +1530,25 @@ class EventsController:
                     self._reconnect_delay = 1.0  # Reset backoff on successful connect
                     self.app.invalidate()
 
-                    # Receive and process event messages
-                    async for message in websocket:
+                    # Receive and process event messages as raw bytes (see LogTailController)
+                    recv = websocket.recv
+                    while True:
                         try:
-                            data = json.loads(message)
+                            message = await recv(decode=False)
+                        except websockets.ConnectionClosedOK:
+                            break
 
-                            # Handle ping/pong keepalive
+                        # Answer heartbeats without running the JSON parser
+                        if message.startswith(_PING_PREFIXES):
+                            await websocket.send(_PONG_MESSAGE)
+                            continue
+
+                        try:
+                            data = _json_loads(message)
+
+                            # Handle ping/pong keepalive (other key orderings)
                             if data.get("type") == "ping":
-                                await websocket.send(json.dumps({"type": "pong"}))
+                                await websocket.send(_PONG_MESSAGE)
                                 continue
 
                             # Extract event details
@@ -900,7 +1576,7 @@ class EventsController:
                                     # Append to output buffer
                                     self.shell._append_output(console_line)
 
-                        except json.JSONDecodeError:
+                        except (json.JSONDecodeError, UnicodeDecodeError):
                             continue
                         except Exception as exc:
                             # Event parsing errors shouldn't crash the loop
@@ -927,33 +1603,59 @@ class EventsController:
         self.app.invalidate()
 
     async def _batch_update_loop(self) -> None:
-        """Batch UI updates every BATCH_INTERVAL to reduce redraw frequency."""
+        """
+        Batch UI updates to reduce redraw frequency.
+
+        Sleeps until an event line is pending and flushes right away, but never
+        more often than every MIN_FLUSH_INTERVAL, so bursts land in one update.
+        """
+        last_flush = 0.0
         try:
             while True:
-                await asyncio.sleep(self.BATCH_INTERVAL)
+                # Idle until the first pending line arrives
+                await self._wake.wait()
+                self._wake.clear()
+
+                # Flushed recently: let the burst accumulate until the ceiling allows
+                since_flush = time.monotonic() - last_flush
+                if since_flush < self.MIN_FLUSH_INTERVAL:
+                    await asyncio.sleep(self.MIN_FLUSH_INTERVAL - since_flush)
+                    self._wake.clear()
+                last_flush = time.monotonic()
 
                 if self._pending_lines:
-                    async with self._lock:
-                        # Collect all pending lines
-                        lines_to_add = "".join(self._pending_lines)
-                        self._pending_lines.clear()
+                    # Collect all pending lines
+                    batch, self._pending_lines = (
+                        self._pending_lines, deque(maxlen=self.MAX_PENDING_LINES)
+                    )
+                    if self._dropped_lines:
+                        # Mark the gap left by lines discarded while flushing stalled
+                        batch = [
+                            f"\033[33m[{self._dropped_lines} event line(s) dropped - "
+                            f"display is falling behind]\033[0m\n",
+                            *batch,
+                        ]
+                        self._dropped_lines = 0
+                    lines_to_add = "".join(batch)
 
                     # Append to buffer
                     if lines_to_add:
-                        # Get current buffer text
-                        current_text = self.events_buffer.text
-                        new_text = current_text + lines_to_add
-
-                        # Trim buffer if exceeding max size
-                        if len(new_text) > self.MAX_BUFFER_CHARS:
-                            # Keep only the last MAX_BUFFER_CHARS characters
-                            # Try to cut at a newline boundary
-                            trim_point = len(new_text) - self.MAX_BUFFER_CHARS
-                            newline_pos = new_text.find('\n', trim_point)
-                            if newline_pos != -1:
-                                new_text = new_text[newline_pos + 1:]
-                            else:
-                                new_text = new_text[trim_point:]
+                        ring = self._line_ring
+                        ring.extend(batch)
+                        self._ring_chars += len(lines_to_add)
+                        trimmed_chars = 0
+
+                        # Trim buffer once it overflows by more than the slack, so
+                        # steady-state ticks only pay for the append. Whole entries
+                        # are evicted from the front until back under MAX_BUFFER_CHARS.
+                        if self._ring_chars > self.MAX_BUFFER_CHARS + self.TRIM_SLACK_CHARS:
+                            while self._ring_chars > self.MAX_BUFFER_CHARS and len(ring) > 1:
+                                evicted = len(ring.popleft())
+                                self._ring_chars -= evicted
+                                trimmed_chars += evicted
+                            new_text = "".join(ring)
+                        else:
+                            new_text = self.events_buffer.text + lines_to_add
 
                         # Update buffer
                         if self.follow_tail:
@@ -961,7 +1663,8 @@ class EventsController:
                             if new_text and new_text.endswith('\n'):
                                 cursor_pos = max(0, len(new_text) - 1)
                         else:
-                            cursor_pos = self.events_buffer.cursor_position
+                            # Keep the view on the same line after a trim
+                            cursor_pos = max(0, self.events_buffer.cursor_position - trimmed_chars)
 
                         self.events_buffer.set_document(
                             Document(text=new_text, cursor_position=cursor_pos),
@@ -989,6 +1692,13 @@ class WatchController:
     # Default refresh interval
     DEFAULT_REFRESH_INTERVAL = 5.0  # 5 seconds
 
+    # Endpoints fetched off the event loop before rendering each target; the
+    # handlers pick the payloads up from the shell's bundle cache
+    PREFETCH_ENDPOINTS = {
+        "devices": ["/devices"],
+        "dashboard": ["/health", "/status", "/devices", "/mappings"],
+    }
+
     def __init__(self, app: Application, watch_buffer: Buffer, shell: ArtNetShell):
         """
         Initialize the watch controller.
@@ -999,6 +1709,7 @@ class WatchController:
             shell: Reference to ArtNetShell instance for executing commands
         """
         self.app = app
+        self._coalesced_invalidate = _CoalescedInvalidator(app)
         self.watch_buffer = watch_buffer
         self.shell = shell
 
@@ -1007,6 +1718,8 @@ class WatchController:
         self.refresh_interval = self.DEFAULT_REFRESH_INTERVAL
         self.watch_task: Optional[asyncio.Task] = None
         self._should_watch = False
+        # Command output shown by the last update, to skip identical refreshes
+        self._last_body: Optional[str] = None
 
     @property
     def is_active(self) -> bool:
@@ -1027,6 +1740,7 @@ class WatchController:
         self.watch_target = target
         self.refresh_interval = interval
         self._should_watch = True
+        self._last_body = None
 
         # Start watch loop task
         self.watch_task = asyncio.create_task(self._watch_loop())
@@ -1059,60 +1773,51 @@ class WatchController:
         """Main watch loop - periodically refresh the watch target."""
         try:
             while self._should_watch:
-                # Clear the watch buffer before refresh
-                self.watch_buffer.set_document(Document(""), bypass_readonly=True)
-
-                # Capture output for this refresh cycle
-                output = ""
-
-                # Add timestamp header
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                output += f"\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
-                output += f"\033[1;36m║  Watch Mode - {self.watch_target.upper():<43} ║\033[0m\n"
-                output += f"\033[1;36m║  Refreshed at {timestamp:<43} ║\033[0m\n"
-                output += f"\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n\n"
-
                 # Execute the watch command and capture output
                 try:
-                    # Save current output buffer position
-                    old_output = self.shell.output_buffer.text
-
-                    # Execute command based on target
-                    if self.watch_target == "devices":
-                        # Check if this is detailed device monitor or simple device list
-                        # "devices" refers to the detailed monitor, use simple list otherwise
-                        self.shell.monitoring_handler._monitor_devices()
-                    elif self.watch_target == "mappings":
-                        self.shell.mapping_handler._show_mappings_list()
-                    elif self.watch_target == "logs":
-                        self.shell.do_logs("")
-                    elif self.watch_target == "dashboard":
-                        self.shell.monitoring_handler._monitor_dashboard()
-
-                    # Capture new output added to output buffer
-                    new_output = self.shell.output_buffer.text
-                    if len(new_output) > len(old_output):
-                        # Extract only the new content
-                        command_output = new_output[len(old_output):]
-                        output += command_output
-
-                        # Reset output buffer to old content (since we're showing it in watch window)
-                        self.shell.output_buffer.set_document(
-                            Document(text=old_output),
-                            bypass_readonly=True
-                        )
+                    # Do the network round trips in a worker thread so the UI
+                    # keeps redrawing; rendering below then hits the cache
+                    endpoints = self.PREFETCH_ENDPOINTS.get(self.watch_target)
+                    if endpoints:
+                        await asyncio.to_thread(self.shell._get_bundle, endpoints)
+
+                    # Route the command's output into a scratch buffer so the
+                    # main output history is never copied or modified
+                    with self.shell._redirect_output_buffer() as capture_buffer:
+                        # Execute command based on target
+                        if self.watch_target == "devices":
+                            # Check if this is detailed device monitor or simple device list
+                            # "devices" refers to the detailed monitor, use simple list otherwise
+                            self.shell.monitoring_handler._monitor_devices(use_bundle_cache=True)
+                        elif self.watch_target == "mappings":
+                            self.shell.mapping_handler._show_mappings_list()
+                        elif self.watch_target == "logs":
+                            self.shell.do_logs("")
+                        elif self.watch_target == "dashboard":
+                            self.shell.monitoring_handler._monitor_dashboard(use_bundle_cache=True)
+
+                    body = capture_buffer.text
 
                 except Exception as exc:
-                    output += f"\033[31mError executing watch command: {exc}\033[0m\n"
-
-                # Update watch buffer with new content
-                self.watch_buffer.set_document(
-                    Document(text=output, cursor_position=0),
-                    bypass_readonly=True
-                )
-
-                # Invalidate UI to trigger redraw
-                self.app.invalidate()
+                    body = f"\033[31mError executing watch command: {exc}\033[0m\n"
+
+                # Unchanged output: leave the buffer alone and skip the redraw.
+                # The header timestamp therefore marks the last change.
+                if body != self._last_body:
+                    self._last_body = body
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+                    output = _WATCH_HEADER_TMPL.format_map(
+                        {"target": self.watch_target.upper(), "ts": timestamp}
+                    ) + body
+
+                    # Update watch buffer with new content (single update per refresh)
+                    self.watch_buffer.set_document(
+                        Document(text=output, cursor_position=0),
+                        bypass_readonly=True
+                    )
+
+                    # Invalidate UI to trigger redraw
+                    self._coalesced_invalidate()
 
                 # Wait for next refresh
                 await asyncio.sleep(self.refresh_interval)
@@ -1138,6 +1843,41 @@ class LogViewController:
     # Auto-refresh interval
     REFRESH_INTERVAL = 5.0  # 5 seconds
 
+    # Pages behind the tail kept in memory for instant back-navigation
+    MAX_CACHED_PAGES = 32
+
+    # How long a cached page is served. Offsets count from the oldest entry,
+    # so once the bridge's bounded log buffer rotates every page shifts even
+    # though the total stays the same.
+    PAGE_CACHE_TTL = 10.0
+
+    # How long a search result is reused for key presses that re-fetch the
+    # same search (the search endpoint ignores paging and level/logger filters)
+    SEARCH_CACHE_TTL = 2.0
+
+    # Distinct table layouts (extra columns x terminal width) kept built
+    MAX_CACHED_CHROME = 16
+
+    # Minimum time between renders; held keys repeat faster than this
+    MIN_RENDER_INTERVAL = 0.02  # 50 renders/s
+
+    # Whether a modal hides the table entirely. The table already fills the
+    # screen, so a tall modal like help is only visible when drawn alone.
+    _MODAL_OCCLUDES: dict[Optional[str], bool] = {
+        "help": True,
+        "filter": False,
+        "search": False,
+    }
+
+    # Level filter cycle: INFO → WARNING → ERROR → CRITICAL → ALL (None) → INFO
+    _NEXT_LEVEL: dict[Optional[str], Optional[str]] = {
+        "INFO": "WARNING",
+        "WARNING": "ERROR",
+        "ERROR": "CRITICAL",
+        "CRITICAL": None,
+        None: "INFO",
+    }
+
     def __init__(self, app: Application, log_view_buffer: Buffer, shell: ArtNetShell):
         """
         Initialize the log view controller.
@@ -1148,6 +1888,7 @@ class LogViewController:
             shell: Reference to ArtNetShell instance for API calls
         """
         self.app = app
+        self._coalesced_invalidate = _CoalescedInvalidator(app)
         self.log_view_buffer = log_view_buffer
         self.shell = shell
 
@@ -1157,6 +1898,31 @@ class LogViewController:
         self.logs_per_page = 50  # Will be recalculated based on terminal height
         self.total_logs = 0
         self.current_logs: list[dict] = []
+        # Extra (non-standard) field names of the page list they were taken from;
+        # every fetch or cache hit assigns a new list, so identity marks a new page
+        self._extra_fields_page: Optional[list[dict]] = None
+        self._extra_field_names: list[str] = []
+        # Last rendered table, reused while only overlays (e.g. modal input,
+        # follow toggle) change: (page list it was built from, terminal size, text)
+        self._table_snapshot: Optional[tuple[list[dict], tuple[int, int], str]] = None
+
+        # Table borders/header keyed on (extra field names, terminal width)
+        self._table_chrome_cache: dict[tuple[tuple[str, ...], int], tuple[str, str]] = {}
+
+        # Incremented per page load; responses to superseded fetches are dropped
+        self._fetch_seq = 0
+
+        # Cached log pages behind the tail, keyed on (offset, page size, filters),
+        # as (fetched at, logs); cleared when the server reports a new total
+        self._page_cache: OrderedDict[tuple, tuple[float, list[dict]]] = OrderedDict()
+        # Last search result: ((pattern, regex, page size), fetched at, body, logs)
+        self._search_cache: Optional[tuple[tuple, float, dict, list[dict]]] = None
+        # Page loads requested by key presses; requests made while one is in
+        # flight coalesce into a single follow-up load
+        self._page_load_task: Optional[asyncio.Task] = None
+        self._page_load_requested = False
+        # Background fetch of the pages either side of the one shown
+        self._prefetch_task: Optional[asyncio.Task] = None
 
         # Filter state
         self.level_filter: Optional[str] = "INFO"  # Default: INFO (excludes DEBUG)
@@ -1165,6 +1931,9 @@ class LogViewController:
         # Search state
         self.search_pattern: Optional[str] = None
         self.search_regex: bool = False
+        # Compiled once per pattern change; a bad regex is reported without a round-trip
+        self._search_re: Optional[re.Pattern[str]] = None
+        self._search_error: Optional[str] = None
 
         # Follow mode
         self.follow_mode: bool = False
@@ -1179,9 +1948,19 @@ class LogViewController:
         # Modal state
         self.in_modal = False
         self.modal_type: Optional[str] = None  # 'filter', 'search', 'help'
-        self.modal_input: str = ""  # Current modal input text
+        # Modal input as a list of characters, edited in place at the cursor;
+        # joined lazily by the modal_input property
+        self._modal_chars: list[str] = []
+        self._modal_text: Optional[str] = ""  # Joined _modal_chars, None when stale
         self.modal_cursor_pos: int = 0  # Cursor position in modal input
 
+        # Fingerprint of the last rendered state (see _render_key)
+        self._last_render_key: Optional[tuple] = None
+        # Set while a render is queued on the event loop (see _schedule_render)
+        self._render_pending = False
+        # Loop time of the last scheduled render
+        self._last_render_at = 0.0
+
     @property
     def is_active(self) -> bool:
         """Check if log view is currently active."""
@@ -1197,14 +1976,25 @@ class LogViewController:
         """Check if currently on the last page."""
         return self.total_pages > 0 and self.current_page == self.total_pages - 1
 
+    @property
+    def modal_input(self) -> str:
+        """Current modal input text."""
+        if self._modal_text is None:
+            self._modal_text = "".join(self._modal_chars)
+        return self._modal_text
+
+    @modal_input.setter
+    def modal_input(self, text: str) -> None:
+        self._modal_chars = list(text)
+        self._modal_text = text
+
     def calculate_logs_per_page(self) -> int:
         """Calculate how many logs fit per page based on terminal height.
 
         Accounts for line wrapping by assuming each log entry may span
         multiple visual rows (average 2 rows per log entry).
         """
-        import shutil
-        terminal_height = shutil.get_terminal_size(fallback=(80, 24)).lines
+        terminal_height = _get_terminal_size().lines
         # Reserve: toolbar (3) + prompt (1) + separator (1) + table header (3) = 8 lines
         available_lines = max(10, terminal_height - 8)
         # Assume average 2 visual rows per log entry due to wrapping
@@ -1233,8 +2023,7 @@ class LogViewController:
         # Set initial filters
         self.level_filter = level
         self.logger_filter = logger
-        self.search_pattern = search_pattern
-        self.search_regex = search_regex
+        self.set_search_pattern(search_pattern, search_regex)
 
         # Calculate logs per page
         self.logs_per_page = self.calculate_logs_per_page()
@@ -1242,17 +2031,8 @@ class LogViewController:
         # Initial load - show loading message
         self._show_loading()
 
-        # Fetch initial logs
-        await self._fetch_logs()
-
-        # Start on last page
-        if self.total_pages > 0:
-            self.current_page = self.total_pages - 1
-
-        # Render initial view
-        await self._render()
-
-        # Start auto-refresh
+        # Start auto-refresh; its first pass fetches and renders the initial
+        # page, so start() returns without waiting on the HTTP round-trip
         self._should_refresh = True
         self.refresh_task = asyncio.create_task(self._refresh_loop())
 
@@ -1270,18 +2050,20 @@ class LogViewController:
 
         self.refresh_task = None
 
+        for task in (self._page_load_task, self._prefetch_task):
+            if task and not task.done():
+                task.cancel()
+        self._page_load_task = None
+        self._prefetch_task = None
+
     def cycle_level_filter(self) -> None:
         """Cycle through level filters: INFO → WARNING → ERROR → CRITICAL → ALL → INFO."""
-        levels = ["INFO", "WARNING", "ERROR", "CRITICAL", None]  # None = ALL
-        try:
-            current_idx = levels.index(self.level_filter)
-            next_idx = (current_idx + 1) % len(levels)
-            self.level_filter = levels[next_idx]
-        except ValueError:
-            self.level_filter = "INFO"
+        # Unknown levels (e.g. DEBUG) restart the cycle at INFO
+        self.level_filter = self._NEXT_LEVEL.get(self.level_filter, "INFO")
 
         # Reset to first page when filter changes
         self.current_page = 0
+        self._page_cache.clear()
 
     def set_logger_filter(self, logger: Optional[str]) -> None:
         """
@@ -1293,6 +2075,7 @@ class LogViewController:
         self.logger_filter = logger.strip() if logger and logger.strip() else None
         # Reset to first page when filter changes
         self.current_page = 0
+        self._page_cache.clear()
 
     def set_search_pattern(self, pattern: Optional[str], regex: bool = False) -> None:
         """
@@ -1304,8 +2087,17 @@ class LogViewController:
         """
         self.search_pattern = pattern.strip() if pattern and pattern.strip() else None
         self.search_regex = regex
+
+        self._search_re = None
+        self._search_error = None
+        if self.search_pattern and regex:
+            try:
+                self._search_re = re.compile(self.search_pattern)
+            except re.error as exc:
+                self._search_error = f"Invalid regex: {exc}"
         # Reset to first page when search changes
         self.current_page = 0
+        self._page_cache.clear()
 
     def toggle_follow_mode(self) -> None:
         """Toggle follow mode on/off."""
@@ -1338,8 +2130,40 @@ class LogViewController:
 
     async def refresh(self) -> None:
         """Manually refresh current page."""
+        # A manual refresh always goes back to the server
+        self._page_cache.clear()
+        self._search_cache = None
+        await self.show_page()
+
+    async def show_page(self) -> None:
+        """Load the current page (from cache when possible) and render it."""
         await self._fetch_logs()
-        await self._render()
+        self._schedule_render()
+        self._schedule_prefetch()
+
+    def request_page(self, refresh: bool = False) -> None:
+        """
+        Load and render the current page on behalf of a key press.
+
+        Held or rapidly repeated keys don't start a fetch each: while a load is
+        in flight, further requests only mark that one more load is needed,
+        which then picks up whatever page and filters are current by then.
+
+        Args:
+            refresh: Bypass cached pages and search results, like refresh()
+        """
+        if refresh:
+            self._page_cache.clear()
+            self._search_cache = None
+        self._page_load_requested = True
+        if self._page_load_task is None or self._page_load_task.done():
+            self._page_load_task = spawn_task(self._page_load_loop())
+
+    async def _page_load_loop(self) -> None:
+        """Serve page load requests until none are outstanding."""
+        while self._page_load_requested:
+            self._page_load_requested = False
+            await self.show_page()
 
     def show_filter_modal(self) -> None:
         """Show modal dialog for logger filter input."""
@@ -1385,20 +2209,15 @@ class LogViewController:
 
     def modal_add_char(self, char: str) -> None:
         """Add character to modal input at cursor position."""
-        self.modal_input = (
-            self.modal_input[:self.modal_cursor_pos] +
-            char +
-            self.modal_input[self.modal_cursor_pos:]
-        )
+        self._modal_chars.insert(self.modal_cursor_pos, char)
+        self._modal_text = None
         self.modal_cursor_pos += 1
 
     def modal_backspace(self) -> None:
         """Delete character before cursor in modal input."""
         if self.modal_cursor_pos > 0:
-            self.modal_input = (
-                self.modal_input[:self.modal_cursor_pos - 1] +
-                self.modal_input[self.modal_cursor_pos:]
-            )
+            del self._modal_chars[self.modal_cursor_pos - 1]
+            self._modal_text = None
             self.modal_cursor_pos -= 1
 
     def modal_move_cursor(self, direction: str) -> None:
@@ -1406,24 +2225,17 @@ class LogViewController:
         if direction == "left":
             self.modal_cursor_pos = max(0, self.modal_cursor_pos - 1)
         elif direction == "right":
-            self.modal_cursor_pos = min(len(self.modal_input), self.modal_cursor_pos + 1)
+            self.modal_cursor_pos = min(len(self._modal_chars), self.modal_cursor_pos + 1)
         elif direction == "home":
             self.modal_cursor_pos = 0
         elif direction == "end":
-            self.modal_cursor_pos = len(self.modal_input)
+            self.modal_cursor_pos = len(self._modal_chars)
 
     def _show_loading(self) -> None:
         """Show loading message."""
-        loading_msg = "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
-        loading_msg += "\033[1;36m║                     Logs View Mode                        ║\033[0m\n"
-        loading_msg += "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
-        loading_msg += "\033[2mLoading logs...\033[0m\n"
-
-        self.log_view_buffer.set_document(
-            Document(text=loading_msg, cursor_position=0),
-            bypass_readonly=True
-        )
-        self.app.invalidate()
+        self._last_render_key = None
+        self.log_view_buffer.set_document(_LOADING_DOC, bypass_readonly=True)
+        self._coalesced_invalidate()
 
     async def _fetch_logs(self) -> None:
         """Fetch logs from API based on current filters and pagination."""
@@ -1431,18 +2243,49 @@ class LogViewController:
             self.error_message = "Not connected"
             return
 
+        # Every load supersedes fetches still in flight, including loads served
+        # from cache below, so a slow earlier response can't overwrite this page
+        self._fetch_seq += 1
+        fetch_seq = self._fetch_seq
+
+        # Don't send a pattern the server would reject anyway
+        if self.search_pattern and self._search_error:
+            self.error_message = self._search_error
+            self.current_logs = []
+            self.total_pages = 0
+            return
+
+        # Serve recently fetched pages behind the tail from cache
+        cache_key = self._page_cache_key(self.current_page)
+        # The search endpoint has no paging or level/logger filters, so page
+        # keys and filter changes within a search would re-fetch the same result
+        search_key = (self.search_pattern, self.search_regex, self.logs_per_page)
+        search_cache = self._search_cache
+        if (
+            self.search_pattern
+            and search_cache is not None
+            and search_cache[0] == search_key
+            and time.monotonic() - search_cache[1] < self.SEARCH_CACHE_TTL
+        ):
+            self.total_logs = search_cache[2].get("count", 0)
+            self.current_logs = search_cache[3]
+            self.total_pages = 1
+            self.error_message = None
+            return
+
+        if not self.search_pattern and self.current_page < self.total_pages - 1:
+            cached = self._page_cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.PAGE_CACHE_TTL:
+                    self._page_cache.move_to_end(cache_key)
+                    self.current_logs = cached[1]
+                    self.error_message = None
+                    return
+                del self._page_cache[cache_key]
+
         try:
             # Build API parameters
-            params = {
-                "lines": self.logs_per_page,
-                "offset": self.current_offset,
-            }
-
-            # Add filters
-            if self.level_filter:
-                params["level"] = self.level_filter
-            if self.logger_filter:
-                params["logger"] = self.logger_filter
+            params = self._page_params(self.current_page)
 
             # Determine endpoint
             if self.search_pattern:
@@ -1459,82 +2302,288 @@ class LogViewController:
                 # Use regular logs endpoint
                 endpoint = "/logs"
 
-            # Make API call
-            response = self.shell.client.get(endpoint, params=params, timeout=5.0)
-            response.raise_for_status()
-            data = response.json()
+            # Make API call off the event loop so keypresses stay responsive
+            page = self.current_page
+            searching = bool(self.search_pattern)
+            data, page_logs = await asyncio.to_thread(
+                self._fetch_page, self.shell.client, endpoint, params, self.logs_per_page
+            )
+            if fetch_seq != self._fetch_seq:
+                # A newer fetch was started while this one was in flight
+                return
 
             # Update state
-            if self.search_pattern:
+            if searching:
                 # Search endpoint returns count, not total
                 self.total_logs = data.get("count", 0)
-                self.current_logs = data.get("logs", [])
+                self.current_logs = page_logs
                 # For search, we get all results at once, no pagination
                 self.total_pages = 1
+                self._search_cache = (search_key, time.monotonic(), data, page_logs)
             else:
-                # Regular endpoint returns total
-                self.total_logs = data.get("total", 0)
-                self.current_logs = data.get("logs", [])
+                # Regular endpoint returns total; a new total shifts the pages
+                total = data.get("total", 0)
+                if total != self.total_logs:
+                    self._page_cache.clear()
+                self.total_logs = total
+                self.current_logs = page_logs
                 # Calculate total pages
                 self.total_pages = (self.total_logs + self.logs_per_page - 1) // self.logs_per_page if self.total_logs > 0 else 0
 
+                # Remember pages behind the tail
+                if page < self.total_pages - 1:
+                    self._cache_page(cache_key, self.current_logs)
+
             # Clear error on success
             self.error_message = None
 
         except Exception as exc:
+            if fetch_seq != self._fetch_seq:
+                return
             self.error_message = str(exc)
             self.current_logs = []
             self.total_pages = 0
 
-    async def _render(self) -> None:
+    def _page_cache_key(self, page: int) -> tuple:
+        """Cache key for a page under the current page size, filters and search."""
+        return (
+            page * self.logs_per_page,
+            self.logs_per_page,
+            self.level_filter,
+            self.logger_filter,
+            self.search_pattern,
+            self.search_regex,
+        )
+
+    def _page_params(self, page: int) -> dict[str, Any]:
+        """Query parameters for a page of the regular /logs endpoint."""
+        params: dict[str, Any] = {
+            "lines": self.logs_per_page,
+            "offset": page * self.logs_per_page,
+        }
+        if self.level_filter:
+            params["level"] = self.level_filter
+        if self.logger_filter:
+            params["logger"] = self.logger_filter
+        return params
+
+    def _cache_page(self, cache_key: tuple, page_logs: list[dict]) -> None:
+        """Store a page behind the tail, evicting the least recently used."""
+        self._page_cache[cache_key] = (time.monotonic(), page_logs)
+        self._page_cache.move_to_end(cache_key)
+        while len(self._page_cache) > self.MAX_CACHED_PAGES:
+            self._page_cache.popitem(last=False)
+
+    def _schedule_prefetch(self) -> None:
+        """Start fetching the neighbouring pages while the current one is shown."""
+        if self.follow_mode or self.search_pattern or self.error_message or self.total_pages < 2:
+            return
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._prefetch_task = asyncio.create_task(self._prefetch_neighbours())
+
+    async def _prefetch_neighbours(self) -> None:
+        """Fetch the pages before and after the current one into the page cache.
+
+        Only pages behind the tail are prefetched, since those are the ones
+        _fetch_logs serves from cache; pages already cached within
+        PAGE_CACHE_TTL are skipped. Failures are ignored; the page is then
+        simply fetched when navigated to.
+        """
+        client = self.shell.client
+        if not client:
+            return
+        for page in (self.current_page - 1, self.current_page + 1):
+            if page < 0 or page >= self.total_pages - 1:
+                continue
+            cache_key = self._page_cache_key(page)
+            cached = self._page_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.PAGE_CACHE_TTL:
+                continue
+            try:
+                data, page_logs = await asyncio.to_thread(
+                    self._fetch_page, client, "/logs", self._page_params(page), self.logs_per_page
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                return
+            if data.get("total", 0) != self.total_logs:
+                # The log has moved on since the shown page was fetched; the
+                # cached offsets no longer line up with it
+                self._page_cache.clear()
+                return
+            self._cache_page(cache_key, page_logs)
+
+    @staticmethod
+    def _fetch_page(
+        client: Any, endpoint: str, params: dict[str, Any], limit: int
+    ) -> tuple[dict, list[dict]]:
+        """
+        Fetch and decode one page of logs; runs in a worker thread.
+
+        Args:
+            client: HTTP client to use
+            endpoint: Logs endpoint path
+            params: Query parameters
+            limit: Maximum number of entries to keep
+
+        Returns:
+            Tuple of (decoded response body, page entries)
+        """
+        response = client.get(endpoint, params=params, timeout=5.0)
+        response.raise_for_status()
+        # Decode the raw body directly (orjson when installed)
+        data = _json_loads(response.content)
+
+        # Never hold or render more than a page, even if the server
+        # ignores the "lines" limit
+        page_logs = data.get("logs", [])[:limit]
+
+        # Warm the timestamp cache here rather than during the render
+        for log_entry in page_logs:
+            timestamp = log_entry.get("timestamp")
+            if isinstance(timestamp, str):
+                _format_timestamp(timestamp)
+
+        return data, page_logs
+
+    def _schedule_render(self) -> None:
+        """Render on the next event loop iteration, merging repeated requests.
+
+        Keystrokes and the auto-refresh can request several renders within a
+        single tick; only one set_document/redraw is done for all of them.
+        A render requested within MIN_RENDER_INTERVAL of the previous one is
+        deferred to the end of that interval, so held keys can't cause a
+        render storm while single key presses still render immediately.
+        """
+        if self._render_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._render()
+            return
+        self._render_pending = True
+        delay = self._last_render_at + self.MIN_RENDER_INTERVAL - loop.time()
+        if delay > 0:
+            loop.call_later(delay, self._do_render)
+        else:
+            loop.call_soon(self._do_render)
+
+    def _do_render(self) -> None:
+        """Run a render scheduled by _schedule_render."""
+        self._render_pending = False
+        self._last_render_at = asyncio.get_running_loop().time()
+        self._render()
+
+    def _render(self) -> None:
         """Render current page of logs to buffer."""
-        output = ""
+        # Auto-refresh on an idle system usually returns the same page; skip
+        # rebuilding the table and redrawing when nothing visible changed
+        render_key = self._render_key()
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # Empty result without an overlay is a static screen
+        if not self.current_logs and not self.error_message and not self.in_modal:
+            self.log_view_buffer.set_document(_NO_LOGS_DOC, bypass_readonly=True)
+            self._coalesced_invalidate()
+            return
+
+        # Modals that fully cover the table are rendered on their own
+        if self.in_modal and self._MODAL_OCCLUDES.get(self.modal_type, False):
+            self.log_view_buffer.set_document(
+                Document(text=self._render_modal(), cursor_position=0),
+                bypass_readonly=True
+            )
+            self._coalesced_invalidate()
+            return
+
+        parts: list[str] = []
 
         # Show logs
         if not self.current_logs:
             if self.error_message:
-                output += f"\033[31mError loading logs: {self.error_message}\033[0m\n"
+                parts.append(f"\033[31mError loading logs: {self.error_message}\033[0m\n")
             else:
-                output += "\033[2mNo logs found matching current filters\033[0m\n"
+                parts.append("\033[2mNo logs found matching current filters\033[0m\n")
         else:
             # Render logs in table format
-            output += self._render_logs_table()
+            parts.append(self._render_logs_table())
 
         # Add modal overlay if in modal mode
         if self.in_modal:
-            output += self._render_modal()
+            parts.append(self._render_modal())
 
         # Update buffer
         self.log_view_buffer.set_document(
-            Document(text=output, cursor_position=0),
+            Document(text="".join(parts), cursor_position=0),
             bypass_readonly=True
         )
-        self.app.invalidate()
+        self._coalesced_invalidate()
 
-    def _render_logs_table(self) -> str:
-        """Render logs in ASCII table format with extra fields and line wrapping."""
-        import shutil
-        import textwrap
-
-        # Standard fields that are always present
-        STANDARD_FIELDS = {"timestamp", "level", "logger", "message"}
-
-        # Collect all extra fields from all logs on this page
-        extra_field_names = set()
-        for log_entry in self.current_logs:
-            for key in log_entry.keys():
-                if key not in STANDARD_FIELDS:
-                    extra_field_names.add(key)
+    def _render_key(self) -> tuple:
+        """
+        Fingerprint everything that affects the rendered view or its toolbar.
 
-        extra_field_names = sorted(extra_field_names)  # Sort for consistent ordering
+        Returns:
+            Tuple that compares equal when a re-render would be a no-op
+        """
+        terminal_size = _get_terminal_size()
+        try:
+            # Every field counts: extra fields are rendered as columns too
+            logs_hash = hash(tuple(tuple(sorted(e.items())) for e in self.current_logs))
+        except TypeError:
+            # Non-scalar field values: never treat the page as unchanged
+            logs_hash = object()
+        return (
+            self.current_page,
+            self.total_pages,
+            self.level_filter,
+            self.logger_filter,
+            self.search_pattern,
+            self.search_regex,
+            self.follow_mode,
+            self.error_message,
+            self.in_modal,
+            self.modal_type,
+            self.modal_input,
+            terminal_size.columns,
+            terminal_size.lines,
+            len(self.current_logs),
+            logs_hash,
+        )
 
-        # Get terminal width
-        terminal_width = shutil.get_terminal_size(fallback=(80, 24)).columns
+    def _render_logs_table(self) -> str:
+        """Render logs in ASCII table format with extra fields and line wrapping."""
+        # Get terminal size once per render (the same cached value _render_key saw)
+        terminal_size = _get_terminal_size()
+        terminal_width, terminal_height = terminal_size
+
+        # Typing in the filter/search modal re-renders on every keystroke, but
+        # the table under it only changes with the page or the terminal size
+        snapshot = self._table_snapshot
+        if (
+            snapshot is not None
+            and snapshot[0] is self.current_logs
+            and snapshot[1] == terminal_size
+        ):
+            return snapshot[2]
+
+        # Collect all extra fields from all logs on this page, once per page
+        if self._extra_fields_page is not self.current_logs:
+            self._extra_fields_page = self.current_logs
+            self._extra_field_names = sorted(  # Sort for consistent ordering
+                set().union(*map(dict.keys, self.current_logs)) - _STANDARD_FIELDS
+            )
+        extra_field_names = self._extra_field_names
 
         # Calculate column widths dynamically
         # Fixed widths for timestamp, level
         timestamp_width = 15  # "Jan 15 14:35:42"
-        level_width = 8
+        level_width = _LEVEL_COL_WIDTH
 
         # Account for borders and padding:
         # Each column has "│ " before and " " after (3 chars per column)
@@ -1556,289 +2605,137 @@ class LogViewController:
         else:
             extra_field_width = 0
 
-        # Helper function to wrap text
-        def wrap_text(text: str, width: int) -> list[str]:
-            """Wrap text to fit within width, returning list of lines."""
-            if not text:
-                return [""]
-            # Use textwrap to handle word boundaries
-            wrapped = textwrap.wrap(text, width=width, break_long_words=True, break_on_hyphens=False)
-            return wrapped if wrapped else [""]
-
-        # Helper function to strip ANSI codes for length calculation
-        def strip_ansi(text: str) -> str:
-            """Remove ANSI color codes from text."""
-            import re
-            return re.sub(r'\033\[[0-9;]+m', '', text)
-
-        # Build table header
-        output = ""
-        output += "\033[1;36m"  # Bold cyan
-        output += "┌─" + "─" * timestamp_width + "─┬"
-        output += "─" + "─" * level_width + "─┬"
-        output += "─" + "─" * logger_width + "─┬"
-        output += "─" + "─" * message_width + "─"
-
-        # Add extra field columns
-        for _ in extra_field_names:
-            output += "┬─" + "─" * extra_field_width + "─"
-
-        output += "┐\033[0m\n"
-
-        # Header row
-        output += "\033[1;36m│\033[0m "
-        output += f"\033[1mTimestamp\033[0m{' ' * (timestamp_width - 9)}"
-        output += " \033[1;36m│\033[0m "
-        output += f"\033[1mLevel\033[0m{' ' * (level_width - 5)}"
-        output += " \033[1;36m│\033[0m "
-        output += f"\033[1mLogger\033[0m{' ' * (logger_width - 6)}"
-        output += " \033[1;36m│\033[0m "
-        output += f"\033[1mMessage\033[0m{' ' * (message_width - 7)}"
-        output += " "
+        # Table chrome only depends on the extra columns and terminal width
+        chrome_key = (tuple(extra_field_names), terminal_width)
+        chrome = self._table_chrome_cache.get(chrome_key)
+        if chrome is None:
+            chrome = self._build_table_chrome(
+                extra_field_names,
+                (timestamp_width, level_width, logger_width, message_width),
+                extra_field_width,
+            )
+            if len(self._table_chrome_cache) >= self.MAX_CACHED_CHROME:
+                self._table_chrome_cache.clear()
+            self._table_chrome_cache[chrome_key] = chrome
+        table_top, bottom_border = chrome
 
-        for field_name in extra_field_names:
-            title = field_name.title()
-            output += "\033[1;36m│\033[0m "
-            output += f"\033[1m{title}\033[0m"
-            # Pad to width
-            output += " " * (extra_field_width - len(title))
-            output += " "
+        # Calculate available lines for rendering
+        # Reserve: toolbar (3) + prompt (1) + separator (1) + table header (3) + bottom border (1) = 9 lines
+        max_content_lines = max(10, terminal_height - 9)
 
-        output += "\033[1;36m│\033[0m\n"
+        rows = _render_rows(
+            self.current_logs,
+            extra_field_names,
+            (timestamp_width, level_width, logger_width, message_width),
+            extra_field_width,
+            max_content_lines,
+        )
 
-        # Separator
-        output += "\033[1;36m├─"
-        output += "─" * timestamp_width + "─┼"
-        output += "─" + "─" * level_width + "─┼"
-        output += "─" + "─" * logger_width + "─┼"
-        output += "─" + "─" * message_width + "─"
+        table = "".join((table_top, rows, bottom_border))
+        self._table_snapshot = (self.current_logs, terminal_size, table)
+        return table
 
-        for _ in extra_field_names:
-            output += "┼─" + "─" * extra_field_width + "─"
+    @staticmethod
+    def _build_table_chrome(
+        extra_field_names: list[str],
+        widths: tuple[int, int, int, int],
+        extra_field_width: int,
+    ) -> tuple[str, str]:
+        """
+        Build the static parts of the logs table.
 
-        output += "┤\033[0m\n"
+        Args:
+            extra_field_names: Sorted extra field column names
+            widths: Timestamp, level, logger and message column widths
+            extra_field_width: Width of each extra field column
 
-        # Calculate available lines for rendering
-        # Get terminal height
-        terminal_height = shutil.get_terminal_size(fallback=(80, 24)).lines
-        # Reserve: toolbar (3) + prompt (1) + separator (1) + table header (3) + bottom border (1) = 9 lines
-        max_content_lines = max(10, terminal_height - 9)
+        Returns:
+            Tuple of (top border + header row + separator, bottom border)
+        """
+        timestamp_width, level_width, logger_width, message_width = widths
 
-        # Track lines rendered
-        lines_rendered = 0
-
-        # Data rows
-        for log_entry in self.current_logs:
-            # Format timestamp: ISO to "Jan 15 14:35:42"
-            timestamp = log_entry.get("timestamp", "")
-            formatted_time = self._format_timestamp(timestamp)
-
-            level = log_entry.get("level", "INFO")
-            logger_name = log_entry.get("logger", "")
-            message = log_entry.get("message", "")
-
-            # Wrap fields that might be long
-            time_lines = [formatted_time[:timestamp_width].ljust(timestamp_width)]
-            level_lines = [level[:level_width].ljust(level_width)]
-            logger_lines = wrap_text(logger_name, logger_width)
-            message_lines = wrap_text(message, message_width)
-
-            # Wrap extra fields
-            extra_lines_dict = {}
-            for field_name in extra_field_names:
-                field_value = str(log_entry.get(field_name, ""))
-                extra_lines_dict[field_name] = wrap_text(field_value, extra_field_width)
-
-            # Calculate max lines needed for this row
-            max_lines = max(
-                len(logger_lines),
-                len(message_lines),
-                max([len(lines) for lines in extra_lines_dict.values()]) if extra_lines_dict else 1,
-                1
-            )
+        # One horizontal run per column, covering the cell plus its padding
+        segments = ["─" * (width + 2) for width in widths]
+        segments += ["─" * (extra_field_width + 2)] * len(extra_field_names)
 
-            # Check if we have enough space to render this entry
-            # If adding this entry would exceed available lines, stop rendering entries
-            if lines_rendered + max_lines > max_content_lines:
-                break
+        # Top border (bold cyan)
+        top = ["\033[1;36m┌" + "┬".join(segments) + "┐\033[0m\n"]
 
-            # Pad all columns to same height
-            while len(time_lines) < max_lines:
-                time_lines.append(" " * timestamp_width)
-            while len(level_lines) < max_lines:
-                level_lines.append(" " * level_width)
-            while len(logger_lines) < max_lines:
-                logger_lines.append(" " * logger_width)
-            while len(message_lines) < max_lines:
-                message_lines.append(" " * message_width)
-            for field_name in extra_field_names:
-                while len(extra_lines_dict[field_name]) < max_lines:
-                    extra_lines_dict[field_name].append(" " * extra_field_width)
-
-            # Color code by level
-            level_colors = {
-                "DEBUG": "\033[36m",      # Cyan
-                "INFO": "\033[32m",       # Green
-                "WARNING": "\033[33m",    # Yellow
-                "ERROR": "\033[31m",      # Red
-                "CRITICAL": "\033[1;31m", # Bold red
-            }
-            level_color = level_colors.get(level, "\033[37m")
-            reset = "\033[0m"
-            dim = "\033[2m"
-            cyan = "\033[36m"
-
-            # Render all lines for this log entry
-            for line_idx in range(max_lines):
-                output += "\033[1;36m│\033[0m "
-
-                # Timestamp (only colored on first line)
-                time_text = time_lines[line_idx]
-                if line_idx == 0:
-                    output += f"{dim}{time_text}{reset}"
-                else:
-                    output += time_text
-                output += " \033[1;36m│\033[0m "
+        # Header row
+        top.append(_COL_SEP)
+        top.append(f"\033[1mTimestamp\033[0m{' ' * (timestamp_width - 9)}")
+        top.append(_COL_SEP_PADDED)
+        top.append(f"\033[1mLevel\033[0m{' ' * (level_width - 5)}")
+        top.append(_COL_SEP_PADDED)
+        top.append(f"\033[1mLogger\033[0m{' ' * (logger_width - 6)}")
+        top.append(_COL_SEP_PADDED)
+        top.append(f"\033[1mMessage\033[0m{' ' * (message_width - 7)}")
+        top.append(" ")
+        for field_name in extra_field_names:
+            title = field_name.title()
+            top.append(_COL_SEP)
+            top.append(f"\033[1m{title}\033[0m")
+            # Pad to width
+            top.append(" " * (extra_field_width - len(title)))
+            top.append(" ")
+        top.append(_ROW_END_NL)
 
-                # Level (only colored on first line)
-                level_text = level_lines[line_idx]
-                if line_idx == 0:
-                    output += f"{level_color}{level_text}{reset}"
-                else:
-                    output += level_text
-                output += " \033[1;36m│\033[0m "
-
-                # Logger (only colored on first line)
-                logger_text = logger_lines[line_idx]
-                # Ensure proper width
-                logger_text = logger_text[:logger_width].ljust(logger_width)
-                if line_idx == 0:
-                    output += f"{cyan}{logger_text}{reset}"
-                else:
-                    output += logger_text
-                output += " \033[1;36m│\033[0m "
-
-                # Message
-                message_text = message_lines[line_idx]
-                # Ensure proper width
-                message_text = message_text[:message_width].ljust(message_width)
-                output += message_text
-                output += " "
-
-                # Extra fields
-                for field_name in extra_field_names:
-                    extra_text = extra_lines_dict[field_name][line_idx]
-                    # Ensure proper width
-                    extra_text = extra_text[:extra_field_width].ljust(extra_field_width)
-                    output += "\033[1;36m│\033[0m "
-                    output += extra_text
-                    output += " "
-
-                output += "\033[1;36m│\033[0m\n"
-
-            # Update line counter
-            lines_rendered += max_lines
+        # Separator
+        top.append("\033[1;36m├" + "┼".join(segments) + "┤\033[0m\n")
 
         # Bottom border
-        output += "\033[1;36m└─"
-        output += "─" * timestamp_width + "─┴"
-        output += "─" + "─" * level_width + "─┴"
-        output += "─" + "─" * logger_width + "─┴"
-        output += "─" + "─" * message_width + "─"
-
-        for _ in extra_field_names:
-            output += "┴─" + "─" * extra_field_width + "─"
-
-        output += "┘\033[0m\n"
+        bottom = "\033[1;36m└" + "┴".join(segments) + "┘\033[0m\n"
 
-        return output
+        return "".join(top), bottom
 
     def _render_modal(self) -> str:
         """Render modal dialog overlay."""
-        modal_output = "\n\n"
-
         if self.modal_type == "filter":
-            modal_output += "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
-            modal_output += "\033[1;36m║                    Logger Filter                          ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[0m║ Enter logger name prefix (e.g., govee.api)                ║\033[0m\n"
-            modal_output += "\033[0m║ Leave empty to clear filter                               ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += f"\033[0m║ {self.modal_input:<57} ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[2m║ Enter: Accept  │  Esc: Cancel                             ║\033[0m\n"
-            modal_output += "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
-
-        elif self.modal_type == "search":
-            modal_output += "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
-            modal_output += "\033[1;36m║                    Search Pattern                         ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[0m║ Enter search pattern                                      ║\033[0m\n"
-            modal_output += "\033[0m║ Leave empty to clear search                               ║\033[0m\n"
+            return "".join((
+                _FILTER_MODAL_HEADER,
+                _MODAL_INPUT_LINE.format(self.modal_input),
+                _FILTER_MODAL_FOOTER,
+            ))
+
+        if self.modal_type == "search":
             regex_status = "ON" if self.search_regex else "OFF"
-            modal_output += f"\033[0m║ Regex mode: {regex_status:<44} ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += f"\033[0m║ {self.modal_input:<57} ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[2m║ Enter: Accept  │  Esc: Cancel  │  Ctrl+R: Toggle Regex   ║\033[0m\n"
-            modal_output += "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
-
-        elif self.modal_type == "help":
-            modal_output += "\033[1;36m╔═══════════════════════════════════════════════════════════╗\033[0m\n"
-            modal_output += "\033[1;36m║                 Logs View - Help                          ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[1;33m║ Navigation:                                               ║\033[0m\n"
-            modal_output += "\033[0m║   PgUp/PgDn       Previous/Next page                      ║\033[0m\n"
-            modal_output += "\033[0m║   Home/End        First/Last page                         ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[1;33m║ Filters:                                                  ║\033[0m\n"
-            modal_output += "\033[0m║   l               Cycle log level filter                  ║\033[0m\n"
-            modal_output += "\033[0m║                   (INFO→WARNING→ERROR→CRITICAL→ALL)       ║\033[0m\n"
-            modal_output += "\033[0m║   f               Set logger filter (prefix match)        ║\033[0m\n"
-            modal_output += "\033[0m║   /               Edit search pattern                     ║\033[0m\n"
-            modal_output += "\033[0m║   c               Clear logger filter                     ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[1;33m║ Actions:                                                  ║\033[0m\n"
-            modal_output += "\033[0m║   r               Manual refresh current page             ║\033[0m\n"
-            modal_output += "\033[0m║   Space           Toggle follow mode (auto-jump to last)  ║\033[0m\n"
-            modal_output += "\033[0m║   ?               Show this help                          ║\033[0m\n"
-            modal_output += "\033[0m║   q/Esc           Exit logs view                          ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[1;33m║ Info:                                                     ║\033[0m\n"
-            modal_output += "\033[0m║   Auto-refresh:   Every 5 seconds                         ║\033[0m\n"
-            modal_output += "\033[0m║   Follow mode:    OFF by default, toggle with Space       ║\033[0m\n"
-            modal_output += "\033[0m║   Level filter:   Additive (ERROR shows ERROR+CRITICAL)   ║\033[0m\n"
-            modal_output += "\033[1;36m╠═══════════════════════════════════════════════════════════╣\033[0m\n"
-            modal_output += "\033[2m║ Press any key to close                                    ║\033[0m\n"
-            modal_output += "\033[1;36m╚═══════════════════════════════════════════════════════════╝\033[0m\n"
-
-        return modal_output
-
-    def _format_timestamp(self, iso_timestamp: str) -> str:
-        """
-        Format ISO timestamp to 'Jan 15 14:35:42'.
+            return "".join((
+                _SEARCH_MODAL_HEADER,
+                _REGEX_MODE_LINE.format(regex_status),
+                _SEARCH_MODAL_MIDDLE,
+                _MODAL_INPUT_LINE.format(self.modal_input),
+                _SEARCH_MODAL_FOOTER,
+            ))
 
-        Args:
-            iso_timestamp: ISO format timestamp like '2025-01-15T14:35:42.123Z'
+        if self.modal_type == "help":
+            return _HELP_MODAL
 
-        Returns:
-            Formatted timestamp string
-        """
-        try:
-            # Parse ISO timestamp
-            dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
-            # Format as "Jan 15 14:35:42"
-            return dt.strftime("%b %d %H:%M:%S")
-        except Exception:
-            # Fallback to original if parsing fails
-            return iso_timestamp[:19] if len(iso_timestamp) >= 19 else iso_timestamp
+        return "\n\n"
 
     async def _refresh_loop(self) -> None:
-        """Auto-refresh loop - refresh every REFRESH_INTERVAL seconds."""
+        """Initial load, then auto-refresh every REFRESH_INTERVAL seconds."""
         try:
+            # Fetch initial logs, starting on the last page
+            await self._fetch_logs()
+            if self.total_pages > 0:
+                self.current_page = self.total_pages - 1
+            self._schedule_render()
+
             while self._should_refresh:
                 await asyncio.sleep(self.REFRESH_INTERVAL)
 
+                # Only poll while following, on the last page, or when there's an
+                # empty/error view to recover; pages behind the tail only shift when
+                # the bridge's log buffer rotates. Filter, search and page changes
+                # fetch on their own via request_page().
+                if (
+                    not self.follow_mode
+                    and not self.is_last_page
+                    and self.total_pages > 0
+                    and not self.error_message
+                ):
+                    continue
+
                 # Save current state
                 old_total_pages = self.total_pages
                 old_page = self.current_page
@@ -1855,7 +2752,7 @@ class LogViewController:
                     self.current_page = self.total_pages - 1
 
                 # Re-render
-                await self._render()
+                self._schedule_render()
 
         except asyncio.CancelledError:
             pass
@@ -15,10 +15,12 @@ import signal
 import sys
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import httpx
 import websockets
@@ -74,6 +76,12 @@ from .help_formatter import HelpFormatter
 from .autocomplete_config import get_completer_dict
 from .shell_utils import load_json, save_json
 
+try:
+    # Optional libuv event loop ('fast' extra, POSIX only) for the stream readers
+    from uvloop import run as _run_event_loop
+except ImportError:  # pragma: no cover
+    from asyncio import run as _run_event_loop
+
 
 # Shell version
 SHELL_VERSION = "1.0.0"
@@ -104,6 +112,10 @@ class ArtNetShell:
         # Initialize response cache for performance
         cache_ttl = float(os.environ.get("DMX_LAN_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
         self.cache = ResponseCache(default_ttl=cache_ttl)
+        # Parsed payloads from _get_bundle(), reused by watch-mode renders
+        self._bundle_cache = ResponseCache(default_ttl=cache_ttl)
+        # Worker pool for _get_bundle(); threads are started on first use
+        self._bundle_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bundle")
 
         # Track previous data for delta detection in watch mode
         self.previous_data: dict[str, Any] = {}
@@ -623,10 +635,13 @@ class ArtNetShell:
             enter_msg += f"\033[33mEvent filter: {event_type}\033[0m\n"
         enter_msg += "\033[2mStreaming events...\033[0m\n\n"
 
-        self.events_buffer.set_document(
-            Document(text=enter_msg, cursor_position=len(enter_msg)),
-            bypass_readonly=True
-        )
+        if self.events_controller:
+            self.events_controller.reset_buffer(enter_msg)
+        else:
+            self.events_buffer.set_document(
+                Document(text=enter_msg, cursor_position=len(enter_msg)),
+                bypass_readonly=True
+            )
 
         # Switch to events mode
         self.in_events_mode = True
@@ -782,6 +797,26 @@ class ArtNetShell:
             # Restore stdout
             sys.stdout = old_stdout
 
+    @contextmanager
+    def _redirect_output_buffer(self) -> Iterator[Buffer]:
+        """
+        Temporarily route command output into a scratch buffer.
+
+        Handlers keep writing through self.output_buffer (directly or via
+        _append_output), but the main output history is never touched, so
+        the caller gets only the new output without copying the whole buffer.
+
+        Yields:
+            Scratch buffer receiving the redirected output
+        """
+        original_buffer = self.output_buffer
+        scratch_buffer = Buffer(read_only=True, multiline=True)
+        self.output_buffer = scratch_buffer
+        try:
+            yield scratch_buffer
+        finally:
+            self.output_buffer = original_buffer
+
     def _cached_get(self, endpoint: str, use_cache: bool = True) -> httpx.Response:
         """
         Perform a GET request with optional caching.
@@ -816,6 +851,43 @@ class ArtNetShell:
 
         return response
 
+    def _get_bundle(self, endpoints: list[str], timeout: Optional[float] = None) -> dict[str, Any]:
+        """
+        Fetch several endpoints together and cache their parsed payloads.
+
+        The bridge has no server-side batch endpoint, so the GETs are issued
+        concurrently over the shared connection pool and joined client-side.
+        Endpoints that fail are left out of the result so callers can fall
+        back to individual requests.
+
+        Args:
+            endpoints: API endpoint paths (e.g., ["/devices", "/status"])
+            timeout: Optional per-request timeout in seconds
+
+        Returns:
+            Dictionary mapping each successfully fetched endpoint to its JSON payload
+        """
+        if not self.client or not endpoints:
+            return {}
+
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+
+        def fetch(endpoint: str) -> Any:
+            response = self.client.get(endpoint, **kwargs)
+            response.raise_for_status()
+            return response.json()
+
+        bundle: dict[str, Any] = {}
+        futures = {endpoint: self._bundle_executor.submit(fetch, endpoint) for endpoint in endpoints}
+        for endpoint, future in futures.items():
+            try:
+                bundle[endpoint] = future.result()
+            except Exception:
+                continue
+            self._bundle_cache.set(endpoint, bundle[endpoint])
+
+        return bundle
+
     def _invalidate_cache(self, pattern: Optional[str] = None) -> None:
         """
         Invalidate cache entries.
@@ -823,14 +895,15 @@ class ArtNetShell:
         Args:
             pattern: Optional pattern to match keys (e.g., "/devices"). If None, clears all.
         """
-        if pattern is None:
-            self.cache.clear()
-        else:
-            # Remove keys matching pattern
-            keys_to_remove = [k for k in self.cache.cache.keys() if pattern in k]
-            for key in keys_to_remove:
-                del self.cache.cache[key]
-            self.cache.stats["size"] = len(self.cache.cache)
+        for cache in (self.cache, self._bundle_cache):
+            if pattern is None:
+                cache.clear()
+            else:
+                # Remove keys matching pattern
+                keys_to_remove = [k for k in cache.cache.keys() if pattern in k]
+                for key in keys_to_remove:
+                    del cache.cache[key]
+                cache.stats["size"] = len(cache.cache)
 
 
     def precmd(self, line: str) -> str:
@@ -1340,6 +1413,7 @@ class ArtNetShell:
         # Stop events controller if running
         if self.events_controller and self.events_controller.is_active:
             await self.events_controller.stop()
+        self._bundle_executor.shutdown(wait=False, cancel_futures=True)
 
     async def cmdloop(self, intro: Optional[str] = None) -> None:
         """
@@ -1400,7 +1474,7 @@ def run_shell(config: ClientConfig) -> None:
     """
     try:
         shell = ArtNetShell(config)
-        asyncio.run(shell.cmdloop())
+        _run_event_loop(shell.cmdloop())
     except KeyboardInterrupt:
         print("\nInterrupted. Goodbye!", file=sys.stderr)
     except Exception as exc:
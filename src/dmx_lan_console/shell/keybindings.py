@@ -6,13 +6,14 @@ interactive shell interface.
 
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING
 
 from prompt_toolkit.document import Document
 from prompt_toolkit.filters import Condition
 from prompt_toolkit.key_binding import KeyBindings
 
+from .shell_utils import spawn_task
+
 if TYPE_CHECKING:
     from .core import ArtNetShell
 
@@ -20,6 +21,14 @@ if TYPE_CHECKING:
 class KeyBindingManager:
     """Manages key bindings for the shell."""
 
+    # Log view page navigation: key -> LogViewController.navigate_page direction
+    _LOG_VIEW_PAGE_KEYS = {
+        "pageup": "prev",
+        "pagedown": "next",
+        "home": "first",
+        "end": "last",
+    }
+
     def __init__(self, shell: ArtNetShell):
         """
         Initialize the key binding manager.
@@ -29,6 +38,25 @@ class KeyBindingManager:
         """
         self.shell = shell
 
+        # Mode filters shared by every binding. prompt_toolkit evaluates the
+        # filters of candidate bindings on each key press, so they're built
+        # once and combined with &/~ (whose results prompt_toolkit caches)
+        # rather than re-created as one lambda per binding.
+        self._in_log_tail = Condition(lambda: shell.in_log_tail_mode)
+        self._in_watch = Condition(lambda: shell.in_watch_mode)
+        self._in_events = Condition(lambda: shell.in_events_mode)
+        self._in_log_view = Condition(lambda: shell.in_log_view_mode)
+        # Only evaluated after _in_log_view, when the controller exists
+        modal_open = Condition(lambda: shell.log_view_controller.in_modal)
+        self._log_view_browsing = self._in_log_view & ~modal_open
+        self._log_view_modal = self._in_log_view & modal_open
+        self._search_modal = self._log_view_modal & Condition(
+            lambda: shell.log_view_controller.modal_type == "search"
+        )
+        self._text_input_modal = self._log_view_modal & Condition(
+            lambda: shell.log_view_controller.modal_type in ("filter", "search")
+        )
+
     def create_key_bindings(self) -> KeyBindings:
         """
         Create and configure all key bindings for the shell.
@@ -37,15 +65,17 @@ class KeyBindingManager:
             Configured KeyBindings instance
         """
         kb = KeyBindings()
+        # Handlers run on every matching key press; bind the shell once
+        shell = self.shell
 
         # Basic shell keybindings
         @kb.add('c-c')
         def _(event):
             """Handle Ctrl+C - clear input or show message."""
-            if self.shell.input_buffer.text:
-                self.shell.input_buffer.reset()
+            if shell.input_buffer.text:
+                shell.input_buffer.reset()
             else:
-                self.shell._append_output("\n[yellow]Use 'exit' or Ctrl+D to quit.[/]\n")
+                shell._append_output("\n[yellow]Use 'exit' or Ctrl+D to quit.[/]\n")
 
         @kb.add('c-d')
         def _(event):
@@ -55,25 +85,25 @@ class KeyBindingManager:
         @kb.add('c-l')
         def _(event):
             """Handle Ctrl+L - clear screen."""
-            self.shell.output_buffer.set_document(Document(""), bypass_readonly=True)
-            event.app.invalidate()
+            # The buffer change redraws the output window
+            shell.output_buffer.set_document(Document(""), bypass_readonly=True)
 
         @kb.add('c-t')
         def _(event):
             """Handle Ctrl+T - toggle follow-tail mode."""
-            self.shell.follow_tail = not self.shell.follow_tail
-            status = "enabled" if self.shell.follow_tail else "disabled"
-            self.shell._append_output(f"\n[dim]Follow-tail {status}[/]\n")
+            shell.follow_tail = not shell.follow_tail
+            status = "enabled" if shell.follow_tail else "disabled"
+            shell._append_output(f"\n[dim]Follow-tail {status}[/]\n")
 
         @kb.add('pageup')
         def _(event):
             """Handle Page Up - scroll output and disable follow-tail."""
             # Disable follow-tail when manually scrolling
-            self.shell.follow_tail = False
+            shell.follow_tail = False
             # Scroll output buffer up by one page
             rows = event.app.output.get_size().rows - 4  # Account for input and toolbar
-            new_pos = max(0, self.shell.output_buffer.cursor_position - rows * 80)  # Approximate line length
-            self.shell.output_buffer.cursor_position = new_pos
+            new_pos = max(0, shell.output_buffer.cursor_position - rows * 80)  # Approximate line length
+            shell.output_buffer.cursor_position = new_pos
             event.app.invalidate()
 
         @kb.add('pagedown')
@@ -81,234 +111,232 @@ class KeyBindingManager:
             """Handle Page Down - scroll output down."""
             # Scroll output buffer down by one page
             rows = event.app.output.get_size().rows - 4  # Account for input and toolbar
-            new_pos = min(len(self.shell.output_buffer.text), self.shell.output_buffer.cursor_position + rows * 80)
-            self.shell.output_buffer.cursor_position = new_pos
+            new_pos = min(len(shell.output_buffer.text), shell.output_buffer.cursor_position + rows * 80)
+            shell.output_buffer.cursor_position = new_pos
             # If we're at the bottom, re-enable follow-tail
-            if self.shell.output_buffer.cursor_position >= len(self.shell.output_buffer.text) - 10:
-                self.shell.follow_tail = True
+            if shell.output_buffer.cursor_position >= len(shell.output_buffer.text) - 10:
+                shell.follow_tail = True
             event.app.invalidate()
 
         # Log tail mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_log_tail_mode))
+        @kb.add('escape', filter=self._in_log_tail)
         def _(event):
             """Handle Escape in log tail mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_tail_mode())
+            spawn_task(shell._exit_log_tail_mode())
 
-        @kb.add('q', filter=Condition(lambda: self.shell.in_log_tail_mode))
+        @kb.add('q', filter=self._in_log_tail)
         def _(event):
             """Handle 'q' in log tail mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_tail_mode())
+            spawn_task(shell._exit_log_tail_mode())
 
-        @kb.add('end', filter=Condition(lambda: self.shell.in_log_tail_mode))
+        @kb.add('end', filter=self._in_log_tail)
         def _(event):
             """Handle End in log tail mode - jump to bottom and enable follow-tail."""
-            if self.shell.log_tail_controller:
-                self.shell.log_tail_controller.enable_follow_tail()
+            ctrl = shell.log_tail_controller
+            if ctrl:
+                ctrl.enable_follow_tail()
                 event.app.invalidate()
 
-        @kb.add('f', filter=Condition(lambda: self.shell.in_log_tail_mode))
+        @kb.add('f', filter=self._in_log_tail)
         def _(event):
             """Handle 'f' in log tail mode - open filter prompt."""
             # For now, show a message (we can implement a filter input dialog later)
-            self.shell.log_tail_buffer.insert_text(
-                "\033[33m[Filter UI not yet implemented - use 'logs tail --level LEVEL --logger LOGGER' to set filters]\033[0m\n"
-            )
-            event.app.invalidate()
+            ctrl = shell.log_tail_controller
+            if ctrl:
+                ctrl.append_notice(
+                    "\033[33m[Filter UI not yet implemented - use 'logs tail --level LEVEL --logger LOGGER' to set filters]\033[0m\n"
+                )
 
         # Watch mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_watch_mode))
+        @kb.add('escape', filter=self._in_watch)
         def _(event):
             """Handle Escape in watch mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_watch_mode())
+            spawn_task(shell._exit_watch_mode())
 
-        @kb.add('q', filter=Condition(lambda: self.shell.in_watch_mode))
+        @kb.add('q', filter=self._in_watch)
         def _(event):
             """Handle 'q' in watch mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_watch_mode())
+            spawn_task(shell._exit_watch_mode())
 
-        @kb.add('+', filter=Condition(lambda: self.shell.in_watch_mode))
+        @kb.add('+', filter=self._in_watch)
         def _(event):
             """Handle '+' in watch mode - decrease refresh interval (faster)."""
-            if self.shell.watch_controller:
-                new_interval = max(0.5, self.shell.watch_controller.refresh_interval - 0.5)
-                self.shell.watch_controller.set_interval(new_interval)
+            ctrl = shell.watch_controller
+            if ctrl:
+                new_interval = max(0.5, ctrl.refresh_interval - 0.5)
+                ctrl.set_interval(new_interval)
                 event.app.invalidate()
 
-        @kb.add('-', filter=Condition(lambda: self.shell.in_watch_mode))
+        @kb.add('-', filter=self._in_watch)
         def _(event):
             """Handle '-' in watch mode - increase refresh interval (slower)."""
-            if self.shell.watch_controller:
-                new_interval = self.shell.watch_controller.refresh_interval + 0.5
-                self.shell.watch_controller.set_interval(new_interval)
+            ctrl = shell.watch_controller
+            if ctrl:
+                new_interval = ctrl.refresh_interval + 0.5
+                ctrl.set_interval(new_interval)
                 event.app.invalidate()
 
         # Log view mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_log_view_mode))
+        @kb.add('escape', filter=self._in_log_view)
         def _(event):
             """Handle Escape in log view mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_view_mode())
+            spawn_task(shell._exit_log_view_mode())
 
-        @kb.add('q', filter=Condition(lambda: self.shell.in_log_view_mode))
+        @kb.add('q', filter=self._in_log_view)
         def _(event):
             """Handle 'q' in log view mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_view_mode())
-
-        @kb.add('pageup', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Page Up in log view mode - previous page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("prev")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('pagedown', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Page Down in log view mode - next page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("next")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+            spawn_task(shell._exit_log_view_mode())
 
-        @kb.add('home', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('pageup', filter=self._log_view_browsing)
+        @kb.add('pagedown', filter=self._log_view_browsing)
+        @kb.add('home', filter=self._log_view_browsing)
+        @kb.add('end', filter=self._log_view_browsing)
         def _(event):
-            """Handle Home in log view mode - first page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("first")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+            """Handle PgUp/PgDn/Home/End in log view mode - previous/next/first/last page."""
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.navigate_page(self._LOG_VIEW_PAGE_KEYS[event.key_sequence[0].key])
+                ctrl.request_page()
 
-        @kb.add('end', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle End in log view mode - last page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("last")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('l', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('l', filter=self._log_view_browsing)
         def _(event):
             """Handle 'l' in log view mode - cycle log level filter."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.cycle_level_filter()
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.cycle_level_filter()
+                ctrl.request_page()
 
-        @kb.add('c', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('c', filter=self._log_view_browsing)
         def _(event):
             """Handle 'c' in log view mode - clear logger filter."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.set_logger_filter(None)
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.set_logger_filter(None)
+                ctrl.request_page()
 
-        @kb.add('r', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('r', filter=self._log_view_browsing)
         def _(event):
             """Handle 'r' in log view mode - manual refresh."""
-            if self.shell.log_view_controller:
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.request_page(refresh=True)
 
-        @kb.add('space', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('space', filter=self._log_view_browsing)
         def _(event):
             """Handle Space in log view mode - toggle follow mode."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.toggle_follow_mode()
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.toggle_follow_mode()
+                ctrl.request_page()
 
-        @kb.add('f', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('f', filter=self._log_view_browsing)
         def _(event):
             """Handle 'f' in log view mode - set logger filter (modal prompt)."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.show_filter_modal()
-                asyncio.create_task(self.shell.log_view_controller._render())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.show_filter_modal()
+                ctrl._schedule_render()
 
-        @kb.add('/', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('/', filter=self._log_view_browsing)
         def _(event):
             """Handle '/' in log view mode - edit search pattern (modal prompt)."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.show_search_modal()
-                asyncio.create_task(self.shell.log_view_controller._render())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.show_search_modal()
+                ctrl._schedule_render()
 
-        @kb.add('?', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
+        @kb.add('?', filter=self._log_view_browsing)
         def _(event):
             """Handle '?' in log view mode - show help modal."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.show_help_modal()
-                asyncio.create_task(self.shell.log_view_controller._render())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.show_help_modal()
+                ctrl._schedule_render()
 
         # Modal mode key bindings (when in modal dialog)
-        @kb.add('enter', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal))
+        @kb.add('enter', filter=self._log_view_modal)
         def _(event):
             """Handle Enter in modal - accept input."""
-            if self.shell.log_view_controller:
-                if self.shell.log_view_controller.modal_type == "help":
+            ctrl = shell.log_view_controller
+            if ctrl:
+                if ctrl.modal_type == "help":
                     # Help modal: just close
-                    self.shell.log_view_controller.close_modal(accept=False)
+                    ctrl.close_modal(accept=False)
                 else:
                     # Filter/Search modal: accept input
-                    self.shell.log_view_controller.close_modal(accept=True)
-                asyncio.create_task(self.shell.log_view_controller.refresh())
+                    ctrl.close_modal(accept=True)
+                ctrl.request_page()
 
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal))
+        @kb.add('escape', filter=self._log_view_modal)
         def _(event):
             """Handle Escape in modal - cancel."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.close_modal(accept=False)
-                asyncio.create_task(self.shell.log_view_controller._render())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.close_modal(accept=False)
+                ctrl._schedule_render()
 
-        @kb.add('c-r', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal and self.shell.log_view_controller.modal_type == "search"))
+        @kb.add('c-r', filter=self._search_modal)
         def _(event):
             """Handle Ctrl+R in search modal - toggle regex mode."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.search_regex = not self.shell.log_view_controller.search_regex
-                asyncio.create_task(self.shell.log_view_controller._render())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.search_regex = not ctrl.search_regex
+                ctrl._schedule_render()
 
-        @kb.add('backspace', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal and self.shell.log_view_controller.modal_type in ("filter", "search")))
+        @kb.add('backspace', filter=self._text_input_modal)
         def _(event):
             """Handle Backspace in modal - delete character."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.modal_backspace()
-                asyncio.create_task(self.shell.log_view_controller._render())
+            ctrl = shell.log_view_controller
+            if ctrl:
+                ctrl.modal_backspace()
+                ctrl._schedule_render()
 
         # Catch all printable characters in modal
-        @kb.add('<any>', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal))
+        @kb.add('<any>', filter=self._log_view_modal)
         def _(event):
             """Handle character input in modal."""
-            if self.shell.log_view_controller:
+            ctrl = shell.log_view_controller
+            if ctrl:
                 # Close help modal on any key
-                if self.shell.log_view_controller.modal_type == "help":
-                    self.shell.log_view_controller.close_modal(accept=False)
-                    asyncio.create_task(self.shell.log_view_controller._render())
+                if ctrl.modal_type == "help":
+                    ctrl.close_modal(accept=False)
+                    ctrl._schedule_render()
                 # Add character to filter/search input
-                elif self.shell.log_view_controller.modal_type in ("filter", "search"):
-                    if hasattr(event, 'data') and event.data and len(event.data) == 1 and event.data.isprintable():
-                        self.shell.log_view_controller.modal_add_char(event.data)
-                        asyncio.create_task(self.shell.log_view_controller._render())
+                elif ctrl.modal_type in ("filter", "search"):
+                    data = getattr(event, 'data', None)
+                    # Printable ASCII needs no unicode table lookup
+                    if data and len(data) == 1 and (' ' <= data <= '~' or data.isprintable()):
+                        ctrl.modal_add_char(data)
+                        ctrl._schedule_render()
 
         # Events mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_events_mode))
+        @kb.add('escape', filter=self._in_events)
         def _(event):
             """Handle Escape in events mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_events_mode())
+            spawn_task(shell._exit_events_mode())
 
-        @kb.add('q', filter=Condition(lambda: self.shell.in_events_mode))
+        @kb.add('q', filter=self._in_events)
         def _(event):
             """Handle 'q' in events mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_events_mode())
+            spawn_task(shell._exit_events_mode())
 
-        @kb.add('end', filter=Condition(lambda: self.shell.in_events_mode))
+        @kb.add('end', filter=self._in_events)
         def _(event):
             """Handle End in events mode - jump to bottom and enable follow-tail."""
-            if self.shell.events_controller:
-                self.shell.events_controller.enable_follow_tail()
+            ctrl = shell.events_controller
+            if ctrl:
+                ctrl.enable_follow_tail()
                 event.app.invalidate()
 
-        @kb.add('f', filter=Condition(lambda: self.shell.in_events_mode))
+        @kb.add('f', filter=self._in_events)
         def _(event):
             """Handle 'f' in events mode - show filter info."""
             # For now, show current filter status as a message in the buffer
-            if self.shell.events_controller:
-                current_filter = self.shell.events_controller.event_type_filter or "None"
+            ctrl = shell.events_controller
+            if ctrl:
+                current_filter = ctrl.event_type_filter or "None"
                 filter_msg = f"\033[33m[Current filter: {current_filter} | Use 'logs events --type device|mapping|health' to set filters]\033[0m\n"
-                # Append to events buffer
-                current_text = self.shell.events_buffer.text
-                self.shell.events_buffer.set_document(
-                    Document(text=current_text + filter_msg, cursor_position=len(current_text + filter_msg)),
-                    bypass_readonly=True
-                )
-                event.app.invalidate()
+                # Append to events buffer (the buffer change redraws it)
+                ctrl.append_notice(filter_msg)
 
         return kb
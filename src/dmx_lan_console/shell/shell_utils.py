@@ -1,14 +1,16 @@
 """Utility functions for the DMX LAN Console shell.
 
 This module contains standalone utility functions for common operations
-like JSON file handling.
+like JSON file handling and starting background tasks.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Coroutine
 
 
 def load_json(file_path: Path, default: Any) -> Any:
@@ -44,3 +46,24 @@ def save_json(file_path: Path, data: Any) -> None:
     """
     with open(file_path, "w") as f:
         json.dump(data, f, indent=2)
+
+
+def spawn_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Start a background task from a key handler or callback.
+
+    On Python 3.12+ the task starts eagerly: it runs synchronously up to its
+    first real suspension instead of waiting for the next event loop
+    iteration, and a coroutine that never suspends (e.g. a page served from
+    cache) completes without being scheduled at all. Older versions fall back
+    to asyncio.create_task.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The started task
+    """
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
@@ -43,16 +43,17 @@ class ToolbarManager:
             return
 
         try:
-            # Fetch health status
-            health_response = self.shell.client.get("/health", timeout=1.0)
-            if health_response.status_code == 200:
-                health_data = health_response.json()
+            # Fetch health and devices in one concurrent round
+            bundle = self.shell._get_bundle(["/health", "/devices"], timeout=1.0)
+
+            # Health status
+            health_data = bundle.get("/health")
+            if isinstance(health_data, dict):
                 self.status["health_status"] = health_data.get("status", "unknown")
 
-            # Fetch device counts
-            devices_response = self.shell.client.get("/devices", timeout=1.0)
-            if devices_response.status_code == 200:
-                devices = devices_response.json()
+            # Device counts
+            if "/devices" in bundle:
+                devices = bundle["/devices"]
                 if isinstance(devices, list):
                     # Active: online (not offline), configured, and enabled
                     active = sum(
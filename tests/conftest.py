@@ -6,14 +6,16 @@ import time
 from contextlib import closing
 
 import pytest
+import pytest_asyncio
 import httpx
+import websockets
 
 
 def find_free_port():
     """Find a free port on localhost."""
     with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("127.0.0.1", 0))
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(("127.0.0.1", 0))
         return s.getsockname()[1]
 
 
@@ -42,7 +44,8 @@ def wait_for_server(url, timeout=10):
 @pytest.fixture(scope="session")
 def mock_server():
     """Start mock server for testing and return its URL."""
-    port = 8000  # Use the default port expected by tests
+    # Per-session free port, so parallel runs (e.g. pytest -n auto) don't collide
+    port = find_free_port()
 
     # Start server in a separate process
     server_process = multiprocessing.Process(target=run_mock_server, args=(port,))
@@ -65,13 +68,49 @@ def mock_server():
         server_process.join()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_server_url(mock_server):
     """Provide mock server URL to tests."""
     return mock_server
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def ws_url(mock_server_url):
+    """Provide the mock server's /events/stream WebSocket URL to tests."""
+    return mock_server_url.replace("http://", "ws://") + "/events/stream"
+
+
+@pytest.fixture(scope="session")
 def client(mock_server_url):
-    """Create HTTP client for testing."""
-    return httpx.Client(base_url=mock_server_url, timeout=5.0)
+    """Create HTTP client for testing, shared so keep-alive connections are reused."""
+    with httpx.Client(
+        base_url=mock_server_url,
+        # Fail fast on connect so a dead mock server doesn't stall every test
+        timeout=httpx.Timeout(connect=1.0, read=5.0, write=2.0, pool=1.0),
+        # Limits belong on the transport; Client(limits=...) is ignored with a custom one
+        transport=httpx.HTTPTransport(
+            retries=1,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        ),
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(mock_server_url):
+    """Create async HTTP client for testing, shared across the session."""
+    async with httpx.AsyncClient(
+        base_url=mock_server_url,
+        timeout=httpx.Timeout(connect=1.0, read=5.0, write=2.0, pool=1.0),
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def events_ws(ws_url):
+    """WebSocket to /events/stream shared by a module's events tests."""
+    # Localhost traffic: skip permessage-deflate and library keepalive pings
+    async with websockets.connect(
+        ws_url, compression=None, ping_interval=None, max_size=2**20
+    ) as websocket:
+        yield websocket
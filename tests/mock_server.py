@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import json
-from datetime import datetime
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException, Header, WebSocket
+from fastapi import FastAPI, HTTPException, Header, Response, WebSocket
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+try:
+    # Optional faster serializer, as in the console's 'fast' extra
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 # Mock data
 FAKE_DEVICES = [
@@ -118,6 +127,14 @@ FAKE_MAPPINGS = [
     },
 ]
 
+# Lookup by ID, kept in sync with FAKE_DEVICES/FAKE_MAPPINGS on create/delete
+_DEVICES_BY_ID: dict[str, dict[str, Any]] = {d["id"]: d for d in FAKE_DEVICES}
+_MAPPINGS_BY_ID: dict[int, dict[str, Any]] = {m["id"]: m for m in FAKE_MAPPINGS}
+
+# Device counts reported by /status, updated on create/update
+online_device_count = sum(1 for d in FAKE_DEVICES if not d["offline"])
+enabled_device_count = sum(1 for d in FAKE_DEVICES if d["enabled"])
+
 # Mock logs
 FAKE_LOGS = [
     {
@@ -146,6 +163,19 @@ FAKE_LOGS = [
     },
 ]
 
+# Log indices by level and by logger, in FAKE_LOGS order
+_LOGS_BY_LEVEL: dict[str, list[dict[str, Any]]] = {}
+_LOGS_BY_LOGGER: dict[str, list[dict[str, Any]]] = {}
+for _log in FAKE_LOGS:
+    _LOGS_BY_LEVEL.setdefault(_log["level"], []).append(_log)
+    _LOGS_BY_LOGGER.setdefault(_log["logger"], []).append(_log)
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with a 'Z' suffix."""
+    # Aware isoformat() always ends in "+00:00" for UTC
+    return datetime.now(timezone.utc).isoformat()[:-6] + "Z"
+
 
 # Pydantic models
 class DeviceCreate(BaseModel):
@@ -189,12 +219,24 @@ class MappingUpdate(BaseModel):
     allow_overlap: Optional[bool] = None
 
 
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI app
-app = FastAPI(title="Mock Govee ArtNet Bridge API")
+app = FastAPI(title="Mock Govee ArtNet Bridge API", default_response_class=FastJSONResponse)
 
 # Counter for generating mapping IDs
 next_mapping_id = 4
 
+# /channel-map response, rebuilt on the next GET after any mapping change
+channel_map_cache: Optional[dict[str, list[dict[str, Any]]]] = None
+
 
 # Authentication middleware (optional check)
 def check_auth(x_api_key: Optional[str] = Header(None)):
@@ -225,8 +267,8 @@ def status():
     return {
         "devices": {
             "total": len(FAKE_DEVICES),
-            "online": sum(1 for d in FAKE_DEVICES if not d["offline"]),
-            "enabled": sum(1 for d in FAKE_DEVICES if d["enabled"]),
+            "online": online_device_count,
+            "enabled": enabled_device_count,
         },
         "mappings": {"total": len(FAKE_MAPPINGS)},
         "artnet": {
@@ -248,7 +290,7 @@ def list_devices():
 @app.get("/devices/{device_id}")
 def get_device(device_id: str):
     """Get a specific device."""
-    device = next((d for d in FAKE_DEVICES if d["id"] == device_id), None)
+    device = _DEVICES_BY_ID.get(device_id)
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
     return device
@@ -257,10 +299,13 @@ def get_device(device_id: str):
 @app.post("/devices")
 def create_device(device: DeviceCreate):
     """Create a manual device."""
+    global online_device_count, enabled_device_count
+
     # Check if device already exists
-    if any(d["id"] == device.id for d in FAKE_DEVICES):
+    if device.id in _DEVICES_BY_ID:
         raise HTTPException(status_code=400, detail="Device already exists")
 
+    now = _utc_now_iso()
     new_device = {
         "id": device.id,
         "ip": device.ip,
@@ -277,17 +322,24 @@ def create_device(device: DeviceCreate):
         "led_count": None,
         "length_meters": None,
         "segment_count": None,
-        "last_seen": datetime.utcnow().isoformat() + "Z",
-        "first_seen": datetime.utcnow().isoformat() + "Z",
+        "last_seen": now,
+        "first_seen": now,
     }
     FAKE_DEVICES.append(new_device)
+    _DEVICES_BY_ID[new_device["id"]] = new_device
+    if not new_device["offline"]:
+        online_device_count += 1
+    if new_device["enabled"]:
+        enabled_device_count += 1
     return new_device
 
 
 @app.patch("/devices/{device_id}")
 def update_device(device_id: str, updates: DeviceUpdate):
     """Update a device."""
-    device = next((d for d in FAKE_DEVICES if d["id"] == device_id), None)
+    global enabled_device_count
+
+    device = _DEVICES_BY_ID.get(device_id)
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
 
@@ -301,6 +353,7 @@ def update_device(device_id: str, updates: DeviceUpdate):
     if updates.description is not None:
         device["description"] = updates.description
     if updates.enabled is not None:
+        enabled_device_count += bool(updates.enabled) - bool(device["enabled"])
         device["enabled"] = updates.enabled
     if updates.capabilities is not None:
         device["capabilities"] = updates.capabilities
@@ -311,7 +364,7 @@ def update_device(device_id: str, updates: DeviceUpdate):
 @app.post("/devices/{device_id}/test")
 def test_device(device_id: str, payload: dict[str, Any]):
     """Send test payload to device."""
-    device = next((d for d in FAKE_DEVICES if d["id"] == device_id), None)
+    device = _DEVICES_BY_ID.get(device_id)
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
 
@@ -321,7 +374,7 @@ def test_device(device_id: str, payload: dict[str, Any]):
 @app.post("/devices/{device_id}/command")
 def command_device(device_id: str, command: dict[str, Any]):
     """Send command to device."""
-    device = next((d for d in FAKE_DEVICES if d["id"] == device_id), None)
+    device = _DEVICES_BY_ID.get(device_id)
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
 
@@ -338,7 +391,7 @@ def list_mappings():
 @app.get("/mappings/{mapping_id}")
 def get_mapping(mapping_id: int):
     """Get a specific mapping."""
-    mapping = next((m for m in FAKE_MAPPINGS if m["id"] == mapping_id), None)
+    mapping = _MAPPINGS_BY_ID.get(mapping_id)
     if not mapping:
         raise HTTPException(status_code=404, detail="Mapping not found")
     return mapping
@@ -347,7 +400,7 @@ def get_mapping(mapping_id: int):
 @app.post("/mappings")
 def create_mapping(mapping: MappingCreate):
     """Create a new mapping."""
-    global next_mapping_id
+    global next_mapping_id, channel_map_cache
 
     # Expand template if provided
     if mapping.template:
@@ -380,7 +433,9 @@ def create_mapping(mapping: MappingCreate):
         new_mapping["fields"] = fields
 
     FAKE_MAPPINGS.append(new_mapping)
+    _MAPPINGS_BY_ID[new_mapping["id"]] = new_mapping
     next_mapping_id += 1
+    channel_map_cache = None
 
     return new_mapping
 
@@ -388,7 +443,9 @@ def create_mapping(mapping: MappingCreate):
 @app.put("/mappings/{mapping_id}")
 def update_mapping(mapping_id: int, updates: MappingUpdate):
     """Update a mapping."""
-    mapping = next((m for m in FAKE_MAPPINGS if m["id"] == mapping_id), None)
+    global channel_map_cache
+
+    mapping = _MAPPINGS_BY_ID.get(mapping_id)
     if not mapping:
         raise HTTPException(status_code=404, detail="Mapping not found")
 
@@ -405,6 +462,7 @@ def update_mapping(mapping_id: int, updates: MappingUpdate):
         mapping["mapping_type"] = updates.mapping_type
     if updates.field is not None:
         mapping["field"] = updates.field
+    channel_map_cache = None
 
     return mapping
 
@@ -412,42 +470,47 @@ def update_mapping(mapping_id: int, updates: MappingUpdate):
 @app.delete("/mappings/{mapping_id}")
 def delete_mapping(mapping_id: int):
     """Delete a mapping."""
-    global FAKE_MAPPINGS
-    mapping = next((m for m in FAKE_MAPPINGS if m["id"] == mapping_id), None)
+    global channel_map_cache
+
+    mapping = _MAPPINGS_BY_ID.pop(mapping_id, None)
     if not mapping:
         raise HTTPException(status_code=404, detail="Mapping not found")
 
-    FAKE_MAPPINGS = [m for m in FAKE_MAPPINGS if m["id"] != mapping_id]
-    return JSONResponse(status_code=204, content=None)
+    FAKE_MAPPINGS.remove(mapping)
+    channel_map_cache = None
+    return Response(status_code=204)
 
 
 @app.get("/channel-map")
 def get_channel_map():
     """Get channel map."""
-    channel_map = {}
-    for mapping in FAKE_MAPPINGS:
-        universe = str(mapping["universe"])
-        if universe not in channel_map:
-            channel_map[universe] = []
-        channel_map[universe].append({
-            "device_id": mapping["device_id"],
-            "channel": mapping["channel"],
-            "length": mapping["length"],
-            "mapping_id": mapping["id"],
-        })
-    return channel_map
+    global channel_map_cache
+
+    if channel_map_cache is None:
+        channel_map = defaultdict(list)
+        for mapping in FAKE_MAPPINGS:
+            channel_map[str(mapping["universe"])].append({
+                "device_id": mapping["device_id"],
+                "channel": mapping["channel"],
+                "length": mapping["length"],
+                "mapping_id": mapping["id"],
+            })
+        channel_map_cache = dict(channel_map)
+    return channel_map_cache
 
 
 # Log endpoints
 @app.get("/logs")
 def get_logs(level: Optional[str] = None, logger: Optional[str] = None, limit: Optional[int] = 50, offset: Optional[int] = 0):
     """Get logs with filtering."""
-    logs = FAKE_LOGS
-
-    if level:
-        logs = [log for log in logs if log["level"] == level]
-    if logger:
-        logs = [log for log in logs if log["logger"] == logger]
+    if level and logger:
+        logs = [log for log in _LOGS_BY_LEVEL.get(level, []) if log["logger"] == logger]
+    elif level:
+        logs = _LOGS_BY_LEVEL.get(level, [])
+    elif logger:
+        logs = _LOGS_BY_LOGGER.get(logger, [])
+    else:
+        logs = FAKE_LOGS
 
     total = len(logs)
     logs = logs[offset : offset + limit]
@@ -455,16 +518,20 @@ def get_logs(level: Optional[str] = None, logger: Optional[str] = None, limit: O
     return {"logs": logs, "total": total, "limit": limit, "offset": offset}
 
 
+@lru_cache(maxsize=128)
+def _compile(pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile a search pattern once per (pattern, flags)."""
+    return re.compile(pattern, flags)
+
+
 @app.get("/logs/search")
 def search_logs(pattern: str, case_sensitive: bool = False, limit: Optional[int] = 100):
     """Search logs."""
-    import re
-
-    flags = 0 if case_sensitive else re.IGNORECASE
+    search = _compile(pattern, 0 if case_sensitive else re.IGNORECASE).search
     matches = []
 
     for log in FAKE_LOGS:
-        if re.search(pattern, log["message"], flags):
+        if search(log["message"]):
             matches.append(log)
             if len(matches) >= limit:
                 break
@@ -476,7 +543,7 @@ def search_logs(pattern: str, case_sensitive: bool = False, limit: Optional[int]
 @app.post("/reload")
 def reload_config():
     """Reload configuration."""
-    return {"status": "reloaded", "timestamp": datetime.utcnow().isoformat() + "Z"}
+    return {"status": "reloaded", "timestamp": _utc_now_iso()}
 
 
 # WebSocket endpoints
@@ -486,21 +553,18 @@ async def websocket_logs(websocket: WebSocket, level: Optional[str] = None, logg
     await websocket.accept()
 
     try:
-        # Send initial logs
-        for log in FAKE_LOGS:
-            if level and log["level"] != level:
-                continue
+        # Send initial logs back to back; clients expect one entry per message
+        for log in _LOGS_BY_LEVEL.get(level, []) if level else FAKE_LOGS:
             if logger and log["logger"] != logger:
                 continue
             await websocket.send_json(log)
-            await asyncio.sleep(0.1)
 
         # Send periodic updates
         counter = 0
         while True:
             await asyncio.sleep(2)
             new_log = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "level": "INFO",
                 "logger": "artnet",
                 "message": f"Periodic update {counter}",
@@ -533,7 +597,7 @@ async def websocket_events(websocket: WebSocket):
         event_sequence = [
             {
                 "event": "device_discovered",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "device_id": "AA:BB:CC:DD:EE:FF:11:22",
                     "ip": "192.168.1.100",
@@ -545,7 +609,7 @@ async def websocket_events(websocket: WebSocket):
             },
             {
                 "event": "device_online",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "device_id": "AA:BB:CC:DD:EE:FF:11:22",
                     "previous_offline_reason": "network_timeout",
@@ -553,7 +617,7 @@ async def websocket_events(websocket: WebSocket):
             },
             {
                 "event": "mapping_created",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "mapping_id": 1,
                     "universe": 0,
@@ -563,7 +627,7 @@ async def websocket_events(websocket: WebSocket):
             },
             {
                 "event": "device_updated",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "device_id": "AA:BB:CC:DD:EE:FF:11:22",
                     "changed_fields": ["brightness", "color"],
@@ -572,7 +636,7 @@ async def websocket_events(websocket: WebSocket):
             },
             {
                 "event": "health_status_changed",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "subsystem": "poller",
                     "status": "degraded",
@@ -582,7 +646,7 @@ async def websocket_events(websocket: WebSocket):
             },
             {
                 "event": "device_offline",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "device_id": "11:22:33:44:55:66:77:88",
                     "reason": "send_failures",
@@ -591,14 +655,14 @@ async def websocket_events(websocket: WebSocket):
             },
             {
                 "event": "mapping_deleted",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "mapping_id": 2,
                 },
             },
             {
                 "event": "health_status_changed",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _utc_now_iso(),
                 "data": {
                     "subsystem": "poller",
                     "status": "ok",
@@ -607,16 +671,23 @@ async def websocket_events(websocket: WebSocket):
             },
         ]
 
+        # Serialize each event once (compact, like send_json), split around
+        # its timestamp - the only field that changes between sends
+        event_templates = [
+            json.dumps(
+                {**event, "timestamp": "\x00"}, separators=(",", ":"), ensure_ascii=False
+            ).split('"\\u0000"')
+            for event in event_sequence
+        ]
+
         # Send events in sequence
         counter = 0
         while True:
             await asyncio.sleep(5)  # Send event every 5 seconds
 
-            # Update timestamp for each event
-            event = event_sequence[counter % len(event_sequence)].copy()
-            event["timestamp"] = datetime.utcnow().isoformat() + "Z"
-
-            await websocket.send_json(event)
+            # Fill in the current timestamp
+            head, tail = event_templates[counter % len(event_templates)]
+            await websocket.send_text(f'{head}"{_utc_now_iso()}"{tail}')
             counter += 1
 
     except Exception:
@@ -26,41 +26,42 @@ def test_client_context_manager():
         assert client is not None
 
 
-# Integration tests require mock server running
-@pytest.mark.integration
-def test_health_check():
-    """Test health check endpoint."""
-    client = BridgeClient("http://localhost:8000")
-    try:
-        health = client.health()
-        assert health["status"] == "ok"
-    except Exception as e:
-        pytest.skip(f"Mock server not running: {e}")
+@pytest.fixture(scope="module")
+def integration_client(mock_server_url):
+    """BridgeClient shared by the integration tests, reusing one connection pool."""
+    with BridgeClient(mock_server_url) as client:
+        yield client
 
 
-@pytest.mark.integration
-def test_list_devices():
-    """Test listing devices."""
-    client = BridgeClient("http://localhost:8000")
-    try:
-        devices = client.list_devices()
-        assert isinstance(devices, list)
-        if devices:
-            assert "id" in devices[0]
-            assert "ip" in devices[0]
-    except Exception as e:
-        pytest.skip(f"Mock server not running: {e}")
+def _check_health(health):
+    assert health["status"] == "ok"
+
 
+def _check_devices(devices):
+    assert isinstance(devices, list)
+    if devices:
+        assert "id" in devices[0]
+        assert "ip" in devices[0]
 
+
+def _check_mappings(mappings):
+    assert isinstance(mappings, list)
+    if mappings:
+        assert "id" in mappings[0]
+        assert "device_id" in mappings[0]
+
+
+# Integration tests run against the session mock server, which conftest
+# starts and health-checks once before any of them run
 @pytest.mark.integration
-def test_list_mappings():
-    """Test listing mappings."""
-    client = BridgeClient("http://localhost:8000")
-    try:
-        mappings = client.list_mappings()
-        assert isinstance(mappings, list)
-        if mappings:
-            assert "id" in mappings[0]
-            assert "device_id" in mappings[0]
-    except Exception as e:
-        pytest.skip(f"Mock server not running: {e}")
+@pytest.mark.parametrize(
+    "method,check",
+    [
+        ("health", _check_health),
+        ("list_devices", _check_devices),
+        ("list_mappings", _check_mappings),
+    ],
+)
+def test_endpoints(integration_client, method, check):
+    """Test health, device and mapping endpoints against the mock server."""
+    check(getattr(integration_client, method)())
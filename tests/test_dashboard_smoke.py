@@ -5,8 +5,44 @@ The mock server starts automatically via pytest fixtures.
 Run these tests: pytest tests/test_dashboard_smoke.py -v
 """
 
+import asyncio
+import json
+
 import pytest
 
+try:
+    # Optional faster decoder, as used by the mock server
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
+
+_PONG = json.dumps({"type": "pong"})
+# Upper bound on frames read while collecting distinct event types
+_MAX_EVENT_FRAMES = 500
+
+_EXPECTED_SUBSYSTEMS = frozenset({"discovery", "sender", "artnet", "api", "poller"})
+_VALID_STATUSES = frozenset({"ok", "degraded", "suppressed", "recovering"})
+
+_VALID_EVENTS = frozenset(
+    {
+        "device_discovered",
+        "device_online",
+        "device_offline",
+        "device_updated",
+        "mapping_created",
+        "mapping_updated",
+        "mapping_deleted",
+        "health_status_changed",
+    }
+)
+
+
+async def _get_json(async_client, path):
+    """GET a path, check it succeeded and decode the JSON body."""
+    response = await async_client.get(path)
+    assert response.status_code == 200
+    return _loads(response.content)
+
 
 def test_health_endpoint_returns_subsystems(client):
     """Test that /health endpoint returns subsystems structure."""
@@ -19,16 +55,13 @@ def test_health_endpoint_returns_subsystems(client):
 
     # Check expected subsystems
     subsystems = data["subsystems"]
-    assert "discovery" in subsystems
-    assert "sender" in subsystems
-    assert "artnet" in subsystems
-    assert "api" in subsystems
-    assert "poller" in subsystems
+    missing = _EXPECTED_SUBSYSTEMS - subsystems.keys()
+    assert not missing, f"missing subsystems: {sorted(missing)}"
 
     # Check subsystem structure
-    for name, subsystem in subsystems.items():
-        assert "status" in subsystem
-        assert subsystem["status"] in ["ok", "degraded", "suppressed", "recovering"]
+    assert all(s.get("status") in _VALID_STATUSES for s in subsystems.values()), {
+        name: s.get("status") for name, s in subsystems.items()
+    }
 
 
 def test_devices_endpoint_includes_mapping_count(client):
@@ -51,27 +84,20 @@ def test_devices_endpoint_includes_mapping_count(client):
     # Note: mapping_count might be added by backend, not in mock yet
 
 
-def test_dashboard_data_availability(client):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dashboard_data_availability(async_client):
     """Test that all required data for dashboard is available."""
-    # Test health endpoint
-    health_response = client.get("/health")
-    assert health_response.status_code == 200
-    health_data = health_response.json()
-
-    # Test devices endpoint
-    devices_response = client.get("/devices")
-    assert devices_response.status_code == 200
-    devices_data = devices_response.json()
-
-    # Test mappings endpoint
-    mappings_response = client.get("/mappings")
-    assert mappings_response.status_code == 200
-    mappings_data = mappings_response.json()
+    # Fetch health, devices and mappings concurrently
+    health_data, devices_data, mappings_data = await asyncio.gather(
+        _get_json(async_client, "/health"),
+        _get_json(async_client, "/devices"),
+        _get_json(async_client, "/mappings"),
+    )
 
     # Verify we can calculate statistics
     total_devices = len(devices_data)
     online_devices = sum(1 for d in devices_data if not d.get("offline"))
-    offline_devices = sum(1 for d in devices_data if d.get("offline"))
+    offline_devices = total_devices - online_devices
     total_mappings = len(mappings_data)
 
     assert total_devices >= 0
@@ -81,109 +107,87 @@ def test_dashboard_data_availability(client):
     assert total_devices == online_devices + offline_devices
 
 
-@pytest.mark.asyncio
-async def test_events_websocket_basic_connection(mock_server_url):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_events_websocket_basic_connection(events_ws):
     """Test basic WebSocket connection to /events/stream."""
-    import websockets
-    import json
-
-    ws_url = mock_server_url.replace("http://", "ws://") + "/events/stream"
-
-    async with websockets.connect(ws_url) as websocket:
-        # Wait for first message (should be an event or ping)
-        message = await websocket.recv()
-        data = json.loads(message)
-
-        # Should have either 'type' (for ping) or 'event' (for event)
-        assert "type" in data or "event" in data
-
-        # If it's a ping, respond with pong
-        if data.get("type") == "ping":
-            await websocket.send(json.dumps({"type": "pong"}))
-
-            # Wait for an actual event
-            message = await websocket.recv()
-            data = json.loads(message)
-
-        # Verify event structure
-        if "event" in data:
-            assert "timestamp" in data
-            assert "data" in data
-
-            # Verify event type is recognized
-            valid_events = [
-                "device_discovered",
-                "device_online",
-                "device_offline",
-                "device_updated",
-                "mapping_created",
-                "mapping_updated",
-                "mapping_deleted",
-                "health_status_changed",
-            ]
-            assert data["event"] in valid_events
-
-
-@pytest.mark.asyncio
-async def test_events_include_required_fields(mock_server_url):
+    # Wait for first message (should be an event or ping)
+    message = await events_ws.recv()
+    data = _loads(message)
+
+    # Should have either 'type' (for ping) or 'event' (for event)
+    assert "type" in data or "event" in data
+
+    # If it's a ping, respond with pong
+    if data.get("type") == "ping":
+        await events_ws.send(_PONG)
+
+        # Wait for an actual event
+        message = await events_ws.recv()
+        data = _loads(message)
+
+    # Verify event structure
+    if "event" in data:
+        assert "timestamp" in data
+        assert "data" in data
+
+        # Verify event type is recognized
+        assert data["event"] in _VALID_EVENTS
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_events_include_required_fields(events_ws):
     """Test that events include all required fields for display."""
-    import websockets
-    import json
-    import asyncio
-
-    ws_url = mock_server_url.replace("http://", "ws://") + "/events/stream"
-
-    async with websockets.connect(ws_url) as websocket:
-        # Collect a few events
-        events_seen = {}
-        timeout = 15  # Wait up to 15 seconds
-
-        async def collect_events():
-            while len(events_seen) < 5:  # Collect at least 5 different event types
-                message = await websocket.recv()
-                data = json.loads(message)
-
-                # Skip pings
-                if data.get("type") == "ping":
-                    await websocket.send(json.dumps({"type": "pong"}))
-                    continue
-
-                if "event" in data:
-                    event_type = data["event"]
-                    events_seen[event_type] = data
-
-        try:
-            await asyncio.wait_for(collect_events(), timeout=timeout)
-        except asyncio.TimeoutError:
-            pass  # It's ok if we don't see all event types
-
-        # Verify we saw at least some events
-        assert len(events_seen) > 0
-
-        # Check device_discovered has required fields
-        if "device_discovered" in events_seen:
-            event_data = events_seen["device_discovered"]["data"]
-            assert "device_id" in event_data
-            assert "ip" in event_data
-
-        # Check device_offline has required fields
-        if "device_offline" in events_seen:
-            event_data = events_seen["device_offline"]["data"]
-            assert "device_id" in event_data
-            assert "reason" in event_data
-
-        # Check mapping_created has required fields
-        if "mapping_created" in events_seen:
-            event_data = events_seen["mapping_created"]["data"]
-            assert "mapping_id" in event_data
-            assert "universe" in event_data
-            assert "channel" in event_data
-
-        # Check health_status_changed has required fields
-        if "health_status_changed" in events_seen:
-            event_data = events_seen["health_status_changed"]["data"]
-            assert "subsystem" in event_data
-            assert "status" in event_data
+    # Collect a few events
+    events_seen = {}
+    timeout = 15  # Wait up to 15 seconds
+
+    async def collect_events():
+        for _ in range(_MAX_EVENT_FRAMES):
+            data = _loads(await events_ws.recv())
+
+            # Skip pings
+            if data.get("type") == "ping":
+                await events_ws.send(_PONG)
+                continue
+
+            event_type = data.get("event")
+            if event_type and event_type not in events_seen:
+                events_seen[event_type] = data
+                if len(events_seen) >= 5:  # Collect at least 5 different event types
+                    break
+
+    try:
+        await asyncio.wait_for(collect_events(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass  # It's ok if we don't see all event types
+
+    # Verify we saw at least some events
+    assert len(events_seen) > 0
+
+    # Check device_discovered has required fields
+    if "device_discovered" in events_seen:
+        event_data = events_seen["device_discovered"]["data"]
+        assert "device_id" in event_data
+        assert "ip" in event_data
+
+    # Check device_offline has required fields
+    if "device_offline" in events_seen:
+        event_data = events_seen["device_offline"]["data"]
+        assert "device_id" in event_data
+        assert "reason" in event_data
+
+    # Check mapping_created has required fields
+    if "mapping_created" in events_seen:
+        event_data = events_seen["mapping_created"]["data"]
+        assert "mapping_id" in event_data
+        assert "universe" in event_data
+        assert "channel" in event_data
+
+    # Check health_status_changed has required fields
+    if "health_status_changed" in events_seen:
+        event_data = events_seen["health_status_changed"]["data"]
+        assert "subsystem" in event_data
+        assert "status" in event_data
 
 
 if __name__ == "__main__":
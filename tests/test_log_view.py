@@ -0,0 +1,141 @@
+"""Tests for the log view controller's page loading."""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from prompt_toolkit.buffer import Buffer
+
+from dmx_lan_console.shell.controllers import LogViewController
+
+
+class _Response:
+    """Minimal stand-in for an httpx response."""
+
+    def __init__(self, body):
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class _StubClient:
+    """Serves /logs pages; requests for a gated offset block until released."""
+
+    def __init__(self, total):
+        self.total = total
+        self.gates = {}
+
+    def get(self, endpoint, params=None, timeout=None):
+        gate = self.gates.get(params["offset"])
+        if gate is not None:
+            gate.wait(5)
+        offset = params["offset"]
+        logs = [
+            {
+                "timestamp": "2026-01-01T00:00:00Z",
+                "level": "INFO",
+                "logger": "test",
+                "message": f"entry {offset + i}",
+            }
+            for i in range(params["lines"])
+        ]
+        return _Response({"logs": logs, "total": self.total})
+
+
+def _make_controller(client, logs_per_page=5):
+    shell = SimpleNamespace(client=client)
+    ctrl = LogViewController(MagicMock(), Buffer(read_only=True), shell)
+    ctrl.logs_per_page = logs_per_page
+    return ctrl
+
+
+@pytest.mark.asyncio
+async def test_slow_fetch_does_not_overwrite_cached_page():
+    """A fetch still in flight must not replace a page served from cache."""
+    client = _StubClient(total=50)
+    ctrl = _make_controller(client)
+
+    # Load the last page (9) and cache page 8
+    ctrl.current_page = 9
+    ctrl.total_pages = 10
+    await ctrl._fetch_logs()
+    ctrl.current_page = 8
+    await ctrl._fetch_logs()
+    page_8 = ctrl.current_logs
+    assert page_8[0]["message"] == "entry 40"
+
+    # Start a slow refresh of page 9, then jump back to the cached page 8
+    gate = threading.Event()
+    client.gates[45] = gate
+    ctrl.current_page = 9
+    slow_fetch = asyncio.create_task(ctrl._fetch_logs())
+    await asyncio.sleep(0.05)
+    ctrl.current_page = 8
+    await ctrl._fetch_logs()
+    assert ctrl.current_logs is page_8
+
+    # The page 9 response lands afterwards and is dropped
+    gate.set()
+    await slow_fetch
+    assert ctrl.current_logs is page_8
+    assert ctrl.current_logs[0]["message"] == "entry 40"
+
+
+@pytest.mark.asyncio
+async def test_page_cache_dropped_when_total_changes():
+    """Cached offsets are discarded once the server reports a different total."""
+    client = _StubClient(total=50)
+    ctrl = _make_controller(client)
+    ctrl.current_page = 9
+    ctrl.total_pages = 10
+    await ctrl._fetch_logs()
+    ctrl.current_page = 8
+    await ctrl._fetch_logs()
+    page_8_key = ctrl._page_cache_key(8)
+    assert page_8_key in ctrl._page_cache
+
+    # New entries arrive: refreshing the tail sees a new total
+    client.total = 55
+    ctrl.current_page = 9
+    await ctrl._fetch_logs()
+    assert page_8_key not in ctrl._page_cache
+    assert ctrl.total_pages == 11
+
+
+@pytest.mark.asyncio
+async def test_page_cache_entries_expire(monkeypatch):
+    """Cached pages are re-fetched after PAGE_CACHE_TTL."""
+    client = _StubClient(total=50)
+    ctrl = _make_controller(client)
+    ctrl.current_page = 8
+    ctrl.total_pages = 10
+    await ctrl._fetch_logs()
+    first = ctrl.current_logs
+
+    await ctrl._fetch_logs()
+    assert ctrl.current_logs is first
+
+    monkeypatch.setattr(LogViewController, "PAGE_CACHE_TTL", 0.0)
+    await ctrl._fetch_logs()
+    assert ctrl.current_logs is not first
+
+
+def test_render_key_tracks_extra_fields():
+    """A change confined to extra fields still changes the render key."""
+    ctrl = _make_controller(None)
+    entry = {"timestamp": "t", "level": "INFO", "logger": "test", "message": "m"}
+    ctrl.current_logs = [dict(entry, device="a")]
+    key = ctrl._render_key()
+
+    ctrl.current_logs = [dict(entry, device="b")]
+    assert ctrl._render_key() != key
+
+    ctrl.current_logs = [dict(entry)]
+    assert ctrl._render_key() != key
+
+    ctrl.current_logs = [dict(entry, device="a")]
+    assert ctrl._render_key() == key